@@ -3,10 +3,22 @@
 # --------
 
 import bpy
+import bmesh
+from bpy.app.handlers import persistent
+from bpy_extras.bmesh_utils import bmesh_linked_uv_islands
 from bpy.props import StringProperty, BoolProperty, EnumProperty, FloatProperty, CollectionProperty
-from mathutils import Matrix, Vector
+from mathutils import Matrix, Quaternion
+from collections import deque
 import numpy as np
+import cProfile
+import functools
+import json
+import math
+import os
+import random
 import re
+import time
+import tracemalloc
 
 # -------------------
 # PLUGIN INFORMATION
@@ -29,11 +41,24 @@ bl_info = {
 
 def register():
     for cls in classes:
+        if issubclass(cls, bpy.types.Operator):
+            track_data_changes(cls)
+            instrument_operator(cls)
         bpy.utils.register_class(cls)
 
+    for handlers in DATA_CHANGE_HANDLERS:
+        if on_data_changed not in handlers:
+            handlers.append(on_data_changed)
+
 def unregister():
+    for handlers in DATA_CHANGE_HANDLERS:
+        if on_data_changed in handlers:
+            handlers.remove(on_data_changed)
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
+        restore_operator(cls)
+        untrack_data_changes(cls)
 
 if __name__ == "__init__":
     register()
@@ -83,6 +108,9 @@ class DodyPanel(bpy.types.Panel):
         row = layout.row()
         row.operator("object.remove_unused_materials", text="Remove Unused Materials")
 
+        row = layout.row()
+        row.operator("object.cleanup_mesh", text="Cleanup Mesh")
+
         layout.separator()
 
         # ============
@@ -121,6 +149,9 @@ class DodyPanel(bpy.types.Panel):
         row = layout.row()
         row.operator("object.retarget_armatures", text="Retarget Armatures")
 
+        row = layout.row()
+        row.operator("object.compare_armature_poses", text="Compare Armature Poses")
+
         layout.separator()
 
         # ===========
@@ -142,6 +173,617 @@ class DodyPanel(bpy.types.Panel):
             row = layout.row()
             row.operator("material.batch_cubic_interp_convert", text="Convert Textures' Interpolation to Cubic")
 
+class DodyStatsPanel(bpy.types.Panel):
+    """The slowest operations recorded this session"""
+    bl_label = "Operation Stats"
+    bl_idname = "OBJECT_PT_dody_stats"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Dody's Shortcuts"
+    bl_parent_id = "OBJECT_PT_remove"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+
+        if not get_telemetry_settings(context)['enabled']:
+            layout.label(text="Telemetry is off in the add-on preferences", icon='INFO')
+            return
+
+        slowest = sorted(RECENT_OPERATIONS, key=lambda record: record['ms'], reverse=True)[:STATS_PANEL_ROWS]
+        if not slowest:
+            layout.label(text="No operations recorded yet", icon='INFO')
+            return
+
+        col = layout.column(align=True)
+        for record in slowest:
+            row = col.row()
+            row.label(text=record['label'], icon='ERROR' if 'FINISHED' not in record['result'] else 'NONE')
+            row.label(text=f"{record['ms']:.0f} ms")
+
+            # Operators that work on the whole scene still record the selection, the label says so
+            details = f"{record['selected_objects']} selected objects, {record['selected_elements']} selected elements"
+            if record['peak_bytes'] is not None:
+                details += f", {format_bytes(record['peak_bytes'])} peak"
+            row = col.row()
+            row.enabled = False
+            row.label(text=details)
+
+# -------------
+# BULK HELPERS
+# -------------
+
+def read_flat_array(collection, attr, width, buffer=None, dtype=np.float32):
+    """Read an attribute of every item in a bpy collection into a (N, width) array with a single foreach_get"""
+    size = len(collection) * width
+    if buffer is None or buffer.size != size or buffer.dtype != dtype:
+        buffer = np.empty(size, dtype=dtype)
+    buffer = buffer.reshape(-1)
+    collection.foreach_get(attr, buffer)
+    return buffer.reshape(-1, width) if width > 1 else buffer
+
+def find_unused_shape_keys(key_blocks, epsilon, stats=None):
+    """Return the names of the shape keys that don't move any vertex away from their relative key"""
+    # One reusable coordinate buffer per mesh, plus a cache of every basis already read
+    buffer = None
+    basis_cache = {}
+    unused = []
+    epsilon_sq = epsilon * epsilon
+
+    for key in key_blocks:
+        relative = key.relative_key
+        if key == relative:
+            continue
+
+        basis = basis_cache.get(relative.name)
+        if basis is None:
+            basis = read_flat_array(relative.data, "co", 3).copy()
+            basis_cache[relative.name] = basis
+            if stats is not None:
+                stats['bytes'] += basis.nbytes
+
+        buffer = read_flat_array(key.data, "co", 3, buffer)
+        if stats is not None:
+            stats['bytes'] += buffer.nbytes
+            stats['keys'] += 1
+
+        delta = buffer - basis
+        if not len(delta) or np.einsum('ij,ij->i', delta, delta).max() <= epsilon_sq:
+            unused.append(key.name)
+
+    return unused
+
+def unique_meshes(objects):
+    """Return each mesh datablock used by the given objects once, so linked duplicates are only processed once"""
+    return list(dict.fromkeys(obj.data for obj in objects if obj.type == 'MESH' and obj.data))
+
+def unique_mesh_objects(objects):
+    """Return the first object using each mesh datablock, for data that lives on the mesh but is reached through an object"""
+    owners = {}
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data and obj.data not in owners:
+            owners[obj.data] = obj
+    return list(owners.values())
+
+# 2x2 linear parts of the UV flips, applied around a pivot by transform_uvs
+UV_FLIP_HORIZONTAL = ((-1.0, 0.0), (0.0, 1.0))
+UV_FLIP_VERTICAL = ((1.0, 0.0), (0.0, -1.0))
+
+def uv_island_indices(bm, mesh, layer_name):
+    """Island index of every loop of a mesh's UV layer, in mesh loop order"""
+    index = {}
+    for i, island in enumerate(bmesh_linked_uv_islands(bm, bm.loops.layers.uv[layer_name])):
+        for face in island:
+            index[face.index] = i
+
+    face_islands = np.fromiter((index[face.index] for face in bm.faces), dtype=np.int64, count=len(bm.faces))
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return np.repeat(face_islands, loop_totals)
+
+def transform_uvs(meshes, linear, pivot='UNIT', all_layers=False):
+    """Apply a 2x2 linear transform around a pivot to the UV layers of each mesh, one read and one write per layer"""
+    linear = np.asarray(linear, dtype=np.float32)
+    buffer = None
+    loop_count = 0
+
+    for mesh in meshes:
+        layers = list(mesh.uv_layers) if all_layers else [mesh.uv_layers.active]
+        bm = None
+        if pivot == 'ISLANDS':
+            # The islands are found on a bmesh copy, with every face shown so each loop belongs to one
+            bm = bmesh.new()
+            bm.from_mesh(mesh)
+            bm.faces.ensure_lookup_table()
+            bm.faces.index_update()
+            for face in bm.faces:
+                face.hide = False
+
+        try:
+            for layer in layers:
+                if layer is None or not len(layer.data):
+                    continue
+
+                uvs = read_flat_array(layer.data, "uv", 2, buffer)
+                buffer = uvs
+
+                if pivot == 'ISLANDS':
+                    # Every loop moves around the average UV of its island
+                    islands = uv_island_indices(bm, mesh, layer.name)
+                    sums = np.zeros((islands.max() + 1, 2), dtype=np.float64)
+                    np.add.at(sums, islands, uvs)
+                    center = (sums / np.bincount(islands)[:, None]).astype(np.float32)[islands]
+                elif pivot == 'BOUNDS':
+                    center = (uvs.min(axis=0) + uvs.max(axis=0)) * 0.5
+                else:
+                    center = np.array((0.5, 0.5), dtype=np.float32)
+
+                uvs -= center
+                uvs[:] = uvs @ linear.T
+                uvs += center
+
+                layer.data.foreach_set("uv", uvs.reshape(-1))
+                loop_count += len(uvs)
+        finally:
+            if bm is not None:
+                bm.free()
+
+    return loop_count
+
+def build_weight_table(mesh):
+    """Flatten a mesh's vertex group weights into CSR-style arrays: per-vertex row offsets plus vertex, group and weight columns"""
+    vertices = mesh.vertices
+    counts = np.zeros(len(vertices), dtype=np.int64)
+    groups = []
+    weights = []
+
+    # Vertex group weights aren't exposed to foreach_get, so this is the one Python pass over them
+    for v in vertices:
+        elements = v.groups
+        counts[v.index] = len(elements)
+        for g in elements:
+            groups.append(g.group)
+            weights.append(g.weight)
+
+    offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    return {
+        'offsets': offsets,
+        'vertices': np.repeat(np.arange(len(vertices), dtype=np.int32), counts),
+        'groups': np.array(groups, dtype=np.int32),
+        'weights': np.array(weights, dtype=np.float32),
+    }
+
+def used_vertex_groups(table, group_count, threshold=0.0001):
+    """Boolean mask of the vertex groups that hold at least one weight above the threshold"""
+    used = np.zeros(group_count, dtype=bool)
+    used[table['groups'][table['weights'] > threshold]] = True
+    return used
+
+def compact_weight_table(table, used):
+    """Drop the rows of removed groups and remap the remaining group indices to their post-removal order"""
+    keep = used[table['groups']]
+    new_index = np.cumsum(used) - 1
+    vertices = table['vertices'][keep]
+    counts = np.bincount(vertices, minlength=len(table['offsets']) - 1)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return {
+        'offsets': offsets,
+        'vertices': vertices,
+        'groups': new_index[table['groups'][keep]].astype(np.int32),
+        'weights': table['weights'][keep],
+    }
+
+def weight_normalize_factors(table, locked):
+    """Per-vertex factors that make the unlocked weights of each vertex sum to 1 alongside its locked ones"""
+    vertex_count = len(table['offsets']) - 1
+    weights = table['weights']
+    is_locked = locked[table['groups']] if len(locked) else np.zeros(len(weights), dtype=bool)
+
+    locked_sum = np.bincount(table['vertices'], weights=np.where(is_locked, weights, 0.0), minlength=vertex_count)
+    free_sum = np.bincount(table['vertices'], weights=np.where(is_locked, 0.0, weights), minlength=vertex_count)
+
+    factors = np.ones(vertex_count, dtype=np.float64)
+    has_free = free_sum > 0.0
+    factors[has_free] = np.clip(1.0 - locked_sum[has_free], 0.0, None) / free_sum[has_free]
+    return factors
+
+def remove_unused_groups(obj, table, used):
+    """Remove the vertex groups outside the used mask, then renormalize only the vertices whose weights change"""
+    v_groups = obj.vertex_groups
+    to_delete = [g for g in v_groups if not used[g.index]]
+    removed = [g.name for g in to_delete]
+
+    for g in to_delete:
+        v_groups.remove(g)
+
+    if removed:
+        table = compact_weight_table(table, used)
+        locked = np.array([g.lock_weight for g in v_groups], dtype=bool)
+        factors = weight_normalize_factors(table, locked)
+
+        vertices = obj.data.vertices
+        for i in np.flatnonzero(np.abs(factors - 1.0) > 1e-6):
+            factor = factors[i]
+            for g in vertices[i].groups:
+                if not locked[g.group]:
+                    g.weight = g.weight * factor
+
+    return removed
+
+def used_material_slots(mesh):
+    """Read every face's material index in bulk and return (used slot mask, face indices)"""
+    slot_count = len(mesh.materials)
+    indices = read_flat_array(mesh.polygons, "material_index", 1, dtype=np.int32)
+    used = np.zeros(slot_count, dtype=bool)
+    if slot_count and len(indices):
+        # Out of range indices render with the last slot
+        np.minimum(indices, slot_count - 1, out=indices)
+        used[np.unique(indices)] = True
+    return used, indices
+
+def compact_material_slots(mesh, users, used, indices):
+    """Drop unused material slots: move the kept ones forward, remap the faces with one foreach_set, then pop the tail"""
+    keep = np.flatnonzero(used)
+    remap = np.zeros(len(used), dtype=np.int32)
+    remap[keep] = np.arange(len(keep), dtype=np.int32)
+
+    # Capture the data materials and each user's slot links before anything moves
+    data_materials = [mesh.materials[i] for i in keep]
+    user_slots = [[(obj.material_slots[i].link, obj.material_slots[i].material) for i in keep] for obj in users]
+
+    for new_index, material in enumerate(data_materials):
+        mesh.materials[new_index] = material
+
+    for obj, slots in zip(users, user_slots):
+        for new_index, (link, material) in enumerate(slots):
+            slot = obj.material_slots[new_index]
+            if slot.link != link:
+                slot.link = link
+            if link == 'OBJECT':
+                slot.material = material
+
+    if len(indices):
+        mesh.polygons.foreach_set("material_index", remap[indices])
+
+    # Popping from the end never shifts an index a face still uses
+    for _ in range(len(used) - len(keep)):
+        mesh.materials.pop()
+
+    mesh.update()
+
+def bulk_remove(owners, collect, remove):
+    """Remove items from each owner once and return a {owner name: [removed names]} summary.
+    Each removal tags its datablock itself, the depsgraph then evaluates them once after the operator."""
+    summary = {}
+
+    for owner in owners:
+        names = collect(owner)
+        if not names:
+            continue
+        remove(owner, names)
+        summary[owner.name] = names
+
+    return summary
+
+def report_removal_summary(operator, summary, label, owner_label):
+    """Report a whole removal run in one line and print the per-owner details to the console"""
+    if not summary:
+        operator.report({'WARNING'}, f"No {label} to remove.")
+        return
+
+    for owner_name, names in summary.items():
+        print(f"Removed {label} from '{owner_name}': {', '.join(names)}")
+
+    total = sum(len(names) for names in summary.values())
+    operator.report({'INFO'}, f"Removed {total} {label} from {len(summary)} {owner_label}.")
+
+def remove_named(collection, names):
+    """Remove items from a bpy collection by name, skipping names that are already gone"""
+    for name in names:
+        item = collection.get(name)
+        if item is not None:
+            collection.remove(item)
+
+def format_bytes(count):
+    """Human readable byte count for reports"""
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+# -----------
+# DATA STATE
+# -----------
+
+# Every depsgraph update (selection changes included), undo step, file load and operation of this add-on bumps this,
+# cached state compares against it instead of rescanning the scene
+DATA_REVISION = {'value': 0}
+
+DATA_CHANGE_HANDLERS = (
+    bpy.app.handlers.depsgraph_update_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
+@persistent
+def on_data_changed(*args):
+    DATA_REVISION['value'] += 1
+
+# Original execute() of every operator wrapped by track_data_changes, put back on unregister
+DATA_TRACKED_OPERATORS = {}
+
+def track_data_changes(cls):
+    """Bump the data revision after each run of an operator, so chained calls in one tick never read stale caches"""
+    if cls in DATA_TRACKED_OPERATORS:
+        return
+    execute = cls.execute
+    DATA_TRACKED_OPERATORS[cls] = execute
+
+    @functools.wraps(execute)
+    def execute_tracked(self, context):
+        try:
+            return execute(self, context)
+        finally:
+            on_data_changed()
+
+    cls.execute = execute_tracked
+
+def untrack_data_changes(cls):
+    execute = DATA_TRACKED_OPERATORS.pop(cls, None)
+    if execute is not None:
+        cls.execute = execute
+
+# Dynamic dropdown items keyed by (provider, datablock), each entry tagged with the revision it was built at.
+# Keeping the lists referenced here also stops Blender from showing freed strings as garbage labels.
+ENUM_ITEMS_CACHE = {}
+
+def cached_enum_items(provider, owner, build, signature=None):
+    """Return a dropdown's items from the cache, calling build() only after the data changed.
+    'signature' is a cheap fingerprint (e.g. the collection's length) that also rebuilds them when a script
+    adds items without a depsgraph update, the add-on's own operations bump the revision themselves."""
+    revision = DATA_REVISION['value']
+    key = (provider, owner.as_pointer() if owner is not None else None)
+
+    entry = ENUM_ITEMS_CACHE.get(key)
+    if entry is None or entry[0] != revision or entry[1] != signature:
+        # Drop entries of datablocks that haven't been asked for since the last change
+        if len(ENUM_ITEMS_CACHE) > 256:
+            for stale in [k for k, (rev, _, _) in ENUM_ITEMS_CACHE.items() if rev != revision]:
+                del ENUM_ITEMS_CACHE[stale]
+        entry = (revision, signature, build())
+        ENUM_ITEMS_CACHE[key] = entry
+    return entry[2]
+
+SELECTION_SUMMARY = {'key': None, 'summary': None}
+
+def invalidate_selection_summary():
+    """Force the next poll to rescan, for scripts that change the selection or its data without a depsgraph update
+    and for context.temp_override(selected_objects=...)"""
+    SELECTION_SUMMARY['key'] = None
+
+def get_selection_summary(context):
+    """What the selected objects carry, computed once per change and read by every poll in O(1)"""
+    # Selection changes fire a depsgraph update, so the selection itself doesn't need to be part of the key
+    active = context.active_object
+    key = (
+        DATA_REVISION['value'],
+        context.view_layer.as_pointer() if context.view_layer else None,
+        active.as_pointer() if active else None,
+    )
+    if SELECTION_SUMMARY['key'] == key:
+        return SELECTION_SUMMARY['summary']
+
+    selected_objects = context.selected_objects or ()
+
+    summary = {
+        'meshes': False,
+        'vertex_groups': False,
+        'shape_keys': False,
+        'uv_layers': False,
+        'colors': False,
+        'materials': False,
+        'modifiers': False,
+        'armatures': 0,
+    }
+
+    for obj in selected_objects:
+        if obj.type == 'ARMATURE':
+            summary['armatures'] += 1
+            continue
+        if obj.type != 'MESH':
+            continue
+
+        mesh = obj.data
+        summary['meshes'] = True
+        summary['vertex_groups'] |= bool(obj.vertex_groups)
+        summary['modifiers'] |= bool(obj.modifiers)
+        summary['materials'] |= bool(obj.material_slots)
+        summary['uv_layers'] |= bool(mesh.uv_layers)
+        summary['shape_keys'] |= bool(mesh.shape_keys and mesh.shape_keys.key_blocks)
+        if not summary['colors']:
+            summary['colors'] = any(att.data_type in {'FLOAT_COLOR', 'BYTE_COLOR'} for att in mesh.attributes)
+
+    SELECTION_SUMMARY['key'] = key
+    SELECTION_SUMMARY['summary'] = summary
+    return summary
+
+# ----------
+# TELEMETRY
+# ----------
+
+# Used when the add-on runs without its preferences (loaded from a script, benchmarks), scripts may flip these
+TELEMETRY_DEFAULTS = {'enabled': True, 'trace_memory': False, 'profile': False, 'write_log': True}
+
+# The log is rotated to operations.1.jsonl once it grows past this size, so at most two files are kept
+TELEMETRY_LOG_MAX_BYTES = 5 * 1024 * 1024
+
+# The latest records of this session, read by the stats panel
+RECENT_OPERATIONS = deque(maxlen=100)
+STATS_PANEL_ROWS = 8
+
+# Original execute() of every instrumented operator, put back on unregister
+INSTRUMENTED_OPERATORS = {}
+
+class DodyPreferences(bpy.types.AddonPreferences):
+    bl_idname = __name__
+
+    enable_telemetry: bpy.props.BoolProperty(
+        name="Record Operations",
+        description="Time every operation of the add-on and list the slowest ones in the Operation Stats panel",
+        default=True
+    ) # type: ignore
+
+    trace_memory: bpy.props.BoolProperty(
+        name="Track Peak Memory",
+        description="Record the peak Python allocations of each operation, slows down Python heavy operations several times",
+        default=False
+    ) # type: ignore
+
+    profile_operators: bpy.props.BoolProperty(
+        name="Profile Operations",
+        description="Run every operation under cProfile and dump a .prof file next to the log",
+        default=False
+    ) # type: ignore
+
+    write_log: bpy.props.BoolProperty(
+        name="Write Log",
+        description="Append every record to a local JSONL log, rotated once it reaches 5 MB",
+        default=True
+    ) # type: ignore
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "enable_telemetry")
+
+        col = layout.column()
+        col.enabled = self.enable_telemetry
+        col.prop(self, "trace_memory")
+        col.prop(self, "profile_operators")
+        col.prop(self, "write_log")
+        col.label(text=f"Log folder: {get_telemetry_dir()}")
+
+def get_telemetry_settings(context):
+    """The add-on preferences as a dict, falling back to TELEMETRY_DEFAULTS when they aren't available"""
+    addon = context.preferences.addons.get(__name__) if context and context.preferences else None
+    if addon is None or addon.preferences is None:
+        return TELEMETRY_DEFAULTS
+
+    prefs = addon.preferences
+    return {
+        'enabled': prefs.enable_telemetry,
+        'trace_memory': prefs.trace_memory,
+        'profile': prefs.profile_operators,
+        'write_log': prefs.write_log,
+    }
+
+def get_telemetry_dir():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), "dody_shortcuts")
+
+def count_selection(context):
+    """Selected objects, plus the vertices and bones of their unique data blocks, the size recorded with each operation"""
+    objects = context.selected_objects or []
+    elements = 0
+    seen = set()
+
+    for obj in objects:
+        data = obj.data
+        if data is None or data in seen:
+            continue
+        seen.add(data)
+        if obj.type == 'MESH':
+            elements += len(data.vertices)
+        elif obj.type == 'ARMATURE':
+            elements += len(data.bones)
+    return len(objects), elements
+
+def record_operation(settings, cls, result, seconds, selected_objects, selected_elements, peak_bytes, profiler):
+    """Keep a record in memory, then dump its profile and append it to the log if enabled"""
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    record = {
+        'time': stamp,
+        'operator': cls.bl_idname,
+        'label': cls.bl_label,
+        'result': sorted(result) if isinstance(result, set) else [str(result)],
+        'ms': round(seconds * 1000.0, 3),
+        'selected_objects': selected_objects,
+        'selected_elements': selected_elements,
+        'peak_bytes': peak_bytes,
+        'file': bpy.path.basename(bpy.data.filepath),
+        'blender': bpy.app.version_string,
+    }
+    RECENT_OPERATIONS.append(record)
+
+    if not (profiler or settings['write_log']):
+        return
+
+    folder = get_telemetry_dir()
+    try:
+        if profiler:
+            profile_dir = os.path.join(folder, "profiles")
+            os.makedirs(profile_dir, exist_ok=True)
+            record['profile'] = os.path.join(profile_dir, f"{cls.bl_idname}-{stamp.replace(':', '')}.prof")
+            profiler.dump_stats(record['profile'])
+
+        if settings['write_log']:
+            os.makedirs(folder, exist_ok=True)
+            log_path = os.path.join(folder, "operations.jsonl")
+            if os.path.exists(log_path) and os.path.getsize(log_path) >= TELEMETRY_LOG_MAX_BYTES:
+                os.replace(log_path, os.path.join(folder, "operations.1.jsonl"))
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        print(f"Could not write the operation log in '{folder}': {e}")
+
+def instrument_operator(cls):
+    """Wrap an operator's execute() so every run gets timed, counted and optionally profiled"""
+    if cls in INSTRUMENTED_OPERATORS:
+        return
+    execute = cls.execute
+    INSTRUMENTED_OPERATORS[cls] = execute
+
+    @functools.wraps(execute)
+    def execute_instrumented(self, context):
+        settings = get_telemetry_settings(context)
+        if not settings['enabled']:
+            return execute(self, context)
+
+        objects, elements = count_selection(context)
+
+        # Leave tracing alone when something else (or an outer operation) already runs it
+        tracing = settings['trace_memory'] and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        profiler = cProfile.Profile() if settings['profile'] else None
+
+        result = {'EXCEPTION'}
+        start = time.perf_counter()
+        try:
+            if profiler:
+                profiler.enable()
+            result = execute(self, context)
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+            peak_bytes = None
+            if tracing:
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            record_operation(settings, cls, result, seconds, objects, elements, peak_bytes, profiler)
+
+    cls.execute = execute_instrumented
+
+def restore_operator(cls):
+    execute = INSTRUMENTED_OPERATORS.pop(cls, None)
+    if execute is not None:
+        cls.execute = execute
+
 # --------
 # CLASSES
 # --------
@@ -154,23 +796,17 @@ class RemoveVertexGroupsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.vertex_groups for obj in context.selected_objects)
+        return get_selection_summary(context)['vertex_groups']
 
     def execute(self, context):
-        removed_groups_report = {}
-
-        for obj in context.selected_objects:
-            if obj.type == 'MESH' and obj.vertex_groups:
-                removed_groups = [group.name for group in obj.vertex_groups]
-                obj.vertex_groups.clear()
-                removed_groups_report[obj.name] = removed_groups
-
-        if not removed_groups_report:
-            self.report({'WARNING'}, "No Vertex Groups to remove.")
-        else:
-            for obj_name, groups in removed_groups_report.items():
-                self.report({'INFO'}, f"Removed Vertex Groups from '{obj_name}': {', '.join(groups)}")
-
+        # Vertex groups live on the mesh, so linked duplicates are only cleared once
+        summary = bulk_remove(
+            unique_mesh_objects(context.selected_objects),
+            lambda obj: [group.name for group in obj.vertex_groups],
+            lambda obj, names: obj.vertex_groups.clear(),
+        )
+
+        report_removal_summary(self, summary, "Vertex Groups", "objects")
         return {'FINISHED'}
 
 # --------------------------------------------------------------------------------------------------------------
@@ -183,24 +819,16 @@ class RemoveModifiersOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.modifiers for obj in context.selected_objects)
+        return get_selection_summary(context)['modifiers']
 
     def execute(self, context):
-        removed_modifiers_report = {}
-
-        for obj in context.selected_objects:
-            if obj.type == 'MESH' and obj.modifiers:
-                removed_modifiers = [mod.name for mod in obj.modifiers]
-                while obj.modifiers:
-                    obj.modifiers.remove(obj.modifiers[0])
-                removed_modifiers_report[obj.name] = removed_modifiers
-
-        if not removed_modifiers_report:
-            self.report({'WARNING'}, "No Modifiers to remove.")
-        else:
-            for obj_name, mods in removed_modifiers_report.items():
-                self.report({'INFO'}, f"Removed Modifiers from '{obj_name}': {', '.join(mods)}")
+        summary = bulk_remove(
+            [obj for obj in context.selected_objects if obj.type == 'MESH'],
+            lambda obj: [mod.name for mod in obj.modifiers],
+            lambda obj, names: obj.modifiers.clear(),
+        )
 
+        report_removal_summary(self, summary, "Modifiers", "objects")
         return {'FINISHED'}
     
 # --------------------------------------------------------------------------------------------------------------
@@ -213,27 +841,16 @@ class RemoveVertexColorsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and any(att.data_type in {'FLOAT_COLOR', 'BYTE_COLOR'} for att in obj.data.attributes) for obj in context.selected_objects)
+        return get_selection_summary(context)['colors']
 
     def execute(self, context):
-        removed_colors_report = {}
-
-        for obj in context.selected_objects:
-            if obj.type == 'MESH' and obj.data:
-                removed_colors = []
-                for att in list(obj.data.attributes):
-                    if att.data_type in {'FLOAT_COLOR', 'BYTE_COLOR'}:
-                        removed_colors.append(att.name)
-                        obj.data.attributes.remove(att)
-                if removed_colors:
-                    removed_colors_report[obj.name] = removed_colors
-
-        if not removed_colors_report:
-            self.report({'WARNING'}, "No Vertex Colors to remove.")
-        else:
-            for obj_name, colors in removed_colors_report.items():
-                self.report({'INFO'}, f"Removed Vertex Colors from '{obj_name}': {', '.join(colors)}")
+        summary = bulk_remove(
+            unique_meshes(context.selected_objects),
+            lambda mesh: [att.name for att in mesh.attributes if att.data_type in {'FLOAT_COLOR', 'BYTE_COLOR'}],
+            lambda mesh, names: remove_named(mesh.attributes, names),
+        )
 
+        report_removal_summary(self, summary, "Vertex Colors", "meshes")
         return {'FINISHED'}
     
 # --------------------------------------------------------------------------------------------------------------
@@ -246,7 +863,7 @@ class RemoveShapeKeysOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.data.shape_keys and obj.data.shape_keys.key_blocks for obj in context.selected_objects)
+        return get_selection_summary(context)['shape_keys']
 
     def execute(self, context):
         removed_keys_report = {}
@@ -279,35 +896,32 @@ class RemoveUnusedShapeKeysOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return any(obj.type == 'MESH' and obj.data.shape_keys for obj in context.selected_objects)
+        return get_selection_summary(context)['shape_keys']
 
     def execute(self, context):
         selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH' and obj.data.shape_keys]
         total_removed = 0
         
         report_data = {}
+        stats = {'keys': 0, 'bytes': 0}
+        scan_time = 0.0
 
         for obj in selected_objects:
             key_blocks = obj.data.shape_keys.key_blocks
+
+            # Scan every key in bulk first, then remove, so the basis cache stays valid
+            start = time.perf_counter()
+            unused_names = find_unused_shape_keys(key_blocks, self.EPSILON, stats)
+            scan_time += time.perf_counter() - start
+
             removed_from_this_obj = []
-            
-            for key in list(key_blocks):
-                if key == key.relative_key:
+            for name in unused_names:
+                key = key_blocks.get(name)
+                if key is None:
                     continue
-                
-                basis_data = key.relative_key.data
-                key_data = key.data
-                is_deformed = False
-                
-                for i in range(len(key_data)):
-                    if (key_data[i].co - basis_data[i].co).length > self.EPSILON:
-                        is_deformed = True
-                        break
-                
-                if not is_deformed:
-                    removed_from_this_obj.append(key.name)
-                    obj.shape_key_remove(key)
-                    total_removed += 1
+                removed_from_this_obj.append(name)
+                obj.shape_key_remove(key)
+                total_removed += 1
 
             if removed_from_this_obj:
                 report_data[obj.name] = removed_from_this_obj
@@ -322,6 +936,10 @@ class RemoveUnusedShapeKeysOperator(bpy.types.Operator):
                 print(message)
                 self.report({'INFO'}, message)
 
+        message = f"Scanned {stats['keys']} shape keys in {scan_time * 1000:.1f} ms ({format_bytes(stats['bytes'])} read)."
+        print(message)
+        self.report({'INFO'}, message)
+
         return {'FINISHED'}
     
 # --------------------------------------------------------------------------------------------------------------
@@ -334,24 +952,16 @@ class RemoveUVMapsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.data.uv_layers for obj in context.selected_objects)
+        return get_selection_summary(context)['uv_layers']
 
     def execute(self, context):
-        removed_uv_maps_report = {}
-
-        for obj in context.selected_objects:
-            if obj.type == 'MESH' and obj.data.uv_layers:
-                removed_uv_maps = [uv.name for uv in obj.data.uv_layers]
-                while obj.data.uv_layers:
-                    obj.data.uv_layers.remove(obj.data.uv_layers[0])
-                removed_uv_maps_report[obj.name] = removed_uv_maps
-
-        if not removed_uv_maps_report:
-            self.report({'WARNING'}, "No UV Maps to remove.")
-        else:
-            for obj_name, uv_maps in removed_uv_maps_report.items():
-                self.report({'INFO'}, f"Removed UV Maps from '{obj_name}': {', '.join(uv_maps)}")
+        summary = bulk_remove(
+            unique_meshes(context.selected_objects),
+            lambda mesh: [uv.name for uv in mesh.uv_layers],
+            lambda mesh, names: remove_named(mesh.uv_layers, names),
+        )
 
+        report_removal_summary(self, summary, "UV Maps", "meshes")
         return {'FINISHED'}
 
 # --------------------------------------------------------------------------------------------------------------
@@ -364,7 +974,7 @@ class RemoveMaterialsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return any(obj.type == 'MESH' and obj.material_slots for obj in context.selected_objects)
+        return get_selection_summary(context)['materials']
 
     def execute(self, context):
         removed_materials_report = {}
@@ -394,29 +1004,33 @@ class RemoveUnusedMaterialsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return any(obj.type == 'MESH' and obj.material_slots for obj in context.selected_objects)
+        return get_selection_summary(context)['materials']
 
     def execute(self, context):
-        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        # Face material indices are stale while an object is in Edit Mode
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Material slots live on the mesh, so linked duplicates are only compacted once
+        selected_objects = unique_mesh_objects(context.selected_objects)
+
+        # Every object sharing a mesh needs its object-linked slots moved along with it
+        mesh_users = {obj.data: [] for obj in selected_objects}
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH' and obj.data in mesh_users:
+                mesh_users[obj.data].append(obj)
         
         for obj in selected_objects:
             mesh = obj.data
-            
-            used_indices = {p.material_index for p in mesh.polygons}
-            
-            initial_slot_count = len(obj.material_slots)
-            removed_names = []
+            used, indices = used_material_slots(mesh)
 
-            for i in range(initial_slot_count - 1, -1, -1):
-                if i not in used_indices:
-                    slot = obj.material_slots[i]
-                    mat_name = slot.material.name if slot.material else f"Empty Slot {i}"
-                    removed_names.append(mat_name)
-                    
-                    obj.active_material_index = i
-                    bpy.ops.object.material_slot_remove()
+            removed_names = []
+            for i in np.flatnonzero(~used):
+                slot = obj.material_slots[i]
+                removed_names.append(slot.material.name if slot.material else f"Empty Slot {i}")
 
             if removed_names:
+                compact_material_slots(mesh, mesh_users[mesh], used, indices)
                 self.report({'INFO'}, f"{obj.name}: Removed {len(removed_names)} slots ({', '.join(removed_names)})")
             else:
                 self.report({'INFO'}, f"{obj.name}: No unused materials found.")
@@ -433,39 +1047,305 @@ class RemoveUnusedVertexGroupsOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return any(obj.type == 'MESH' and obj.vertex_groups for obj in context.selected_objects)
+        return get_selection_summary(context)['vertex_groups']
 
     def execute(self, context):
-        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        # Vertex groups live on the mesh, so linked duplicates are only processed once
+        selected_objects = [obj for obj in unique_mesh_objects(context.selected_objects) if obj.vertex_groups]
         
         for obj in selected_objects:
-            mesh = obj.data
-            v_groups = obj.vertex_groups
-            
-            used_indices = set()
-            for v in mesh.vertices:
-                for g in v.groups:
-                    if g.weight > 0.0001:
-                        used_indices.add(g.group)
-
-            all_groups = list(v_groups)
-            removed_count = 0
-            
-            to_delete = [g for g in all_groups if g.index not in used_indices]
+            start = time.perf_counter()
             
-            for g in to_delete:
-                v_groups.remove(g)
-                removed_count += 1
+            table = build_weight_table(obj.data)
+            used = used_vertex_groups(table, len(obj.vertex_groups))
+
+            # Normalize on the compacted table and only touch the vertices whose weights change
+            removed_count = len(remove_unused_groups(obj, table, used))
 
             if removed_count > 0:
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.vertex_group_normalize_all(lock_active=False)
-                self.report({'INFO'}, f"{obj.name}: Removed {removed_count} unused groups.")
+                elapsed = (time.perf_counter() - start) * 1000
+                self.report({'INFO'}, f"{obj.name}: Removed {removed_count} unused groups in {elapsed:.1f} ms.")
 
         return {'FINISHED'}
 
 # --------------------------------------------------------------------------------------------------------------
 
+class CleanupMeshOperator(bpy.types.Operator):
+    """Run the selected cleanups in one pass over each mesh, as a single undo step"""
+    bl_idname = "object.cleanup_mesh"
+    bl_label = "Cleanup Mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Same "no change" threshold as Remove Unused Shape Keys
+    EPSILON = 0.00001
+
+    STAGES = (
+        ('vertex_groups', "Vertex Groups"),
+        ('shape_keys', "Shape Keys"),
+        ('materials', "Material Slots"),
+        ('vertex_colors', "Vertex Colors"),
+    )
+
+    vertex_groups: bpy.props.BoolProperty(
+        name="Unused Vertex Groups",
+        description="Remove vertex groups without any weight and normalize the remaining weights",
+        default=True
+    ) # type: ignore
+
+    shape_keys: bpy.props.BoolProperty(
+        name="Unused Shape Keys",
+        description="Remove shape keys that don't move any vertex away from their relative key",
+        default=True
+    ) # type: ignore
+
+    materials: bpy.props.BoolProperty(
+        name="Unused Materials",
+        description="Remove material slots that aren't assigned to any faces",
+        default=True
+    ) # type: ignore
+
+    vertex_colors: bpy.props.BoolProperty(
+        name="All Vertex Colors",
+        description="Remove every color attribute",
+        default=False
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return get_selection_summary(context)['meshes']
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        col = self.layout.column()
+        for stage, _ in self.STAGES:
+            col.prop(self, stage)
+
+    def execute(self, context):
+        stages = [stage for stage, _ in self.STAGES if getattr(self, stage)]
+        if not stages:
+            self.report({'WARNING'}, "No cleanup stages selected.")
+            return {'CANCELLED'}
+
+        # Weights and face material indices are stale while an object is in Edit Mode
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        # All of these live on the mesh, so linked duplicates are only cleaned once
+        selected_objects = unique_mesh_objects(context.selected_objects)
+        timings = dict.fromkeys(stages, 0.0)
+
+        mesh_users = {}
+        if 'materials' in stages:
+            mesh_users = {obj.data: [] for obj in selected_objects}
+            for obj in bpy.data.objects:
+                if obj.type == 'MESH' and obj.data in mesh_users:
+                    mesh_users[obj.data].append(obj)
+
+        # 1. Analysis: read each mesh's arrays once and decide everything before touching the data
+        plans = []
+        for obj in selected_objects:
+            mesh = obj.data
+            plan = {'obj': obj}
+
+            if 'vertex_groups' in stages and obj.vertex_groups:
+                start = time.perf_counter()
+                table = build_weight_table(mesh)
+                used = used_vertex_groups(table, len(obj.vertex_groups))
+                if not used.all():
+                    plan['vertex_groups'] = (table, used)
+                timings['vertex_groups'] += time.perf_counter() - start
+
+            if 'shape_keys' in stages and mesh.shape_keys:
+                start = time.perf_counter()
+                unused = find_unused_shape_keys(mesh.shape_keys.key_blocks, self.EPSILON)
+                if unused:
+                    plan['shape_keys'] = unused
+                timings['shape_keys'] += time.perf_counter() - start
+
+            if 'materials' in stages and len(mesh.materials):
+                start = time.perf_counter()
+                used, indices = used_material_slots(mesh)
+                if not used.all():
+                    plan['materials'] = (used, indices)
+                timings['materials'] += time.perf_counter() - start
+
+            if 'vertex_colors' in stages:
+                names = [att.name for att in mesh.attributes if att.data_type in {'FLOAT_COLOR', 'BYTE_COLOR'}]
+                if names:
+                    plan['vertex_colors'] = names
+
+            if len(plan) > 1:
+                plans.append(plan)
+
+        # 2. Apply every mutation together
+        removed = {stage: {} for stage in stages}
+        for plan in plans:
+            obj = plan['obj']
+            mesh = obj.data
+
+            if 'vertex_groups' in plan:
+                start = time.perf_counter()
+                removed['vertex_groups'][obj.name] = remove_unused_groups(obj, *plan['vertex_groups'])
+                timings['vertex_groups'] += time.perf_counter() - start
+
+            if 'shape_keys' in plan:
+                start = time.perf_counter()
+                key_blocks = mesh.shape_keys.key_blocks
+                names = [name for name in plan['shape_keys'] if key_blocks.get(name) is not None]
+                for name in names:
+                    obj.shape_key_remove(key_blocks[name])
+                removed['shape_keys'][obj.name] = names
+                timings['shape_keys'] += time.perf_counter() - start
+
+            if 'materials' in plan:
+                start = time.perf_counter()
+                used, indices = plan['materials']
+                removed['materials'][obj.name] = [
+                    obj.material_slots[i].material.name if obj.material_slots[i].material else f"Empty Slot {i}"
+                    for i in np.flatnonzero(~used)
+                ]
+                compact_material_slots(mesh, mesh_users[mesh], used, indices)
+                timings['materials'] += time.perf_counter() - start
+
+            if 'vertex_colors' in plan:
+                start = time.perf_counter()
+                remove_named(mesh.attributes, plan['vertex_colors'])
+                removed['vertex_colors'][obj.name] = plan['vertex_colors']
+                timings['vertex_colors'] += time.perf_counter() - start
+
+            # One tag per mesh for all of its changes
+            mesh.update_tag()
+
+        # 3. One consolidated report, per-object details go to the console
+        labels = dict(self.STAGES)
+        for stage in stages:
+            for obj_name, names in removed[stage].items():
+                print(f"Cleanup Mesh: removed {labels[stage]} from '{obj_name}': {', '.join(names)}")
+
+        counts = ", ".join(f"{sum(len(names) for names in removed[stage].values())} {labels[stage]}" for stage in stages)
+        times = ", ".join(f"{labels[stage]} {timings[stage] * 1000:.1f} ms" for stage in stages)
+
+        if not plans:
+            self.report({'INFO'}, f"Cleanup complete: Nothing to remove on {len(selected_objects)} meshes ({times}).")
+        else:
+            self.report({'INFO'}, f"Cleaned {len(plans)} of {len(selected_objects)} meshes, removed {counts} ({times}).")
+        return {'FINISHED'}
+
+# --------------------------------------------------------------------------------------------------------------
+
+def evaluate_shape_keys(obj, depsgraph):
+    """Run every shape key of an object through its modifier stack, returning {key name: (N, 3) coords} or None if the stack changes topology.
+    Each key needs its own depsgraph.update(), which only re-evaluates this object, so the cost is the key count times its modifier stack."""
+    key_blocks = obj.data.shape_keys.key_blocks
+    coords = {}
+    vertex_count = None
+
+    for index, key in enumerate(key_blocks):
+        # With 'show only', the evaluated mesh is exactly this key pushed through the modifiers
+        obj.active_shape_key_index = index
+        depsgraph.update()
+
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh_eval = obj_eval.to_mesh()
+        try:
+            if vertex_count is None:
+                vertex_count = len(mesh_eval.vertices)
+            elif len(mesh_eval.vertices) != vertex_count:
+                return None
+            coords[key.name] = read_flat_array(mesh_eval.vertices, "co", 3).copy()
+        finally:
+            obj_eval.to_mesh_clear()
+
+    return coords
+
+def copy_fmodifier(modifier, new_modifier):
+    """Copy the settings of an F-Curve modifier, including the control points of an Envelope"""
+    # The polynomial order sizes the coefficients array, so it has to be set first
+    properties = sorted(modifier.bl_rna.properties, key=lambda prop: prop.identifier != "poly_order")
+    for prop in properties:
+        if prop.is_readonly or prop.identifier in {"rna_type", "type"}:
+            continue
+        value = getattr(modifier, prop.identifier)
+        setattr(new_modifier, prop.identifier, value[:] if getattr(prop, "is_array", False) else value)
+
+    if modifier.type == 'ENVELOPE':
+        for point in modifier.control_points:
+            new_point = new_modifier.control_points.add(point.frame)
+            new_point.min, new_point.max = point.min, point.max
+
+def copy_fcurve_keys(fcurve, new_fcurve):
+    """Copy the keyframes and modifiers of one F-Curve onto another, the keys in one foreach_get/foreach_set per attribute"""
+    for modifier in list(new_fcurve.modifiers):
+        new_fcurve.modifiers.remove(modifier)
+    for modifier in fcurve.modifiers:
+        copy_fmodifier(modifier, new_fcurve.modifiers.new(modifier.type))
+
+    count = len(fcurve.keyframe_points)
+    if count:
+        new_fcurve.keyframe_points.add(count)
+        for attr, width, dtype in (("co", 2, np.float32), ("handle_left", 2, np.float32), ("handle_right", 2, np.float32),
+                                   ("interpolation", 1, np.int32), ("easing", 1, np.int32),
+                                   ("handle_left_type", 1, np.int32), ("handle_right_type", 1, np.int32)):
+            values = read_flat_array(fcurve.keyframe_points, attr, width, dtype=dtype)
+            new_fcurve.keyframe_points.foreach_set(attr, values.reshape(-1))
+    new_fcurve.extrapolation = fcurve.extrapolation
+    new_fcurve.update()
+
+def copy_drivers(source_id, target_id):
+    """Recreate the action and drivers of one ID on another one with matching data paths, keyframes and modifiers included"""
+    source_anim = source_id.animation_data
+    if not source_anim:
+        return
+
+    target_anim = target_id.animation_data_create()
+    target_anim.action = source_anim.action
+
+    for fcurve in source_anim.drivers:
+        new_fcurve = target_id.driver_add(fcurve.data_path, fcurve.array_index)
+        driver, new_driver = fcurve.driver, new_fcurve.driver
+        new_driver.type = driver.type
+        new_driver.expression = driver.expression
+        new_driver.use_self = driver.use_self
+
+        for var in driver.variables:
+            new_var = new_driver.variables.new()
+            new_var.name = var.name
+            new_var.type = var.type
+            for target, new_target in zip(var.targets, new_var.targets):
+                if var.type == 'SINGLE_PROP':
+                    new_target.id_type = target.id_type
+                new_target.id = target.id
+                new_target.data_path = target.data_path
+                new_target.bone_target = target.bone_target
+                new_target.transform_type = target.transform_type
+                new_target.transform_space = target.transform_space
+                new_target.rotation_mode = target.rotation_mode
+
+        copy_fcurve_keys(fcurve, new_fcurve)
+
+def restore_shape_keys(obj, old_key, coords):
+    """Rebuild an object's shape keys on its new mesh from evaluated coordinates and the old Key's settings"""
+    old_blocks = old_key.key_blocks
+    for old_block in old_blocks:
+        new_block = obj.shape_key_add(name=old_block.name, from_mix=False)
+        new_block.data.foreach_set("co", coords[old_block.name].reshape(-1))
+        new_block.value = old_block.value
+        new_block.slider_min = old_block.slider_min
+        new_block.slider_max = old_block.slider_max
+        new_block.mute = old_block.mute
+        new_block.vertex_group = old_block.vertex_group
+        new_block.interpolation = old_block.interpolation
+
+    # Relative keys can only be linked once every block exists
+    new_key = obj.data.shape_keys
+    new_key.use_relative = old_key.use_relative
+    for old_block in old_blocks:
+        new_key.key_blocks[old_block.name].relative_key = new_key.key_blocks[old_block.relative_key.name]
+
+    copy_drivers(old_key, new_key)
+
 class ApplyAllModifiersOperator(bpy.types.Operator):
     """Apply all modifiers on selected objects (skipping Armatures by default)"""
     bl_idname = "object.apply_modifiers"
@@ -497,42 +1377,99 @@ class ApplyAllModifiersOperator(bpy.types.Operator):
         column.label(text="Warning: This action cannot be undone!", icon='ERROR')
 
     def execute(self, context):
-        targets = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        targets = [obj for obj in bpy.data.objects if obj.type == 'MESH' and obj.name in context.view_layer.objects]
         
         if not targets:
             self.report({'WARNING'}, "No mesh objects found in the scene.")
             return {'CANCELLED'}
 
-        apply_count = 0
-        obj_count = 0
-
-        original_active = context.view_layer.objects.active
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
+        # Modifiers we keep are hidden from the evaluation, the others are baked and then removed
+        hidden_modifiers = []
+        applied_modifiers = {}
         for obj in targets:
-            if obj.name not in context.view_layer.objects:
-                continue
-                
-            context.view_layer.objects.active = obj
-            
-            modifiers = obj.modifiers[:]
-            
-            for mod in modifiers:
+            for mod in obj.modifiers:
+                if not mod.show_viewport:
+                    continue
                 if mod.type == 'ARMATURE' and not self.apply_armature:
+                    mod.show_viewport = False
+                    hidden_modifiers.append(mod)
+                else:
+                    applied_modifiers.setdefault(obj, []).append(mod.name)
+
+        # One evaluation of the whole scene covers every object's stack
+        depsgraph = context.evaluated_depsgraph_get()
+
+        apply_count = 0
+        obj_count = 0
+        skipped = []
+
+        try:
+            for obj, mod_names in applied_modifiers.items():
+                # Hidden or viewport-disabled objects are not evaluated, their modifiers would be dropped unbaked
+                if obj.evaluated_get(depsgraph) is obj:
+                    skipped.append(obj.name)
                     continue
-                
                 try:
-                    bpy.ops.object.modifier_apply(modifier=mod.name)
-                    apply_count += 1
+                    apply_count += self.apply_evaluated(obj, depsgraph, mod_names)
+                    obj_count += 1
                 except Exception as e:
-                    self.report({'ERROR'}, f"{obj.name}: Could not apply {mod.name}. Is the object hidden?")
-            
-            obj_count += 1
+                    self.report({'ERROR'}, f"{obj.name}: Could not apply modifiers ({e}).")
+        finally:
+            for mod in hidden_modifiers:
+                mod.show_viewport = True
 
-        context.view_layer.objects.active = original_active
+        if skipped:
+            self.report({'WARNING'}, f"Skipped {len(skipped)} objects that are not evaluated (hidden or disabled in viewports): {', '.join(skipped)}")
 
         self.report({'INFO'}, f"Applied {apply_count} modifiers applied across {obj_count} meshes.")
         return {'FINISHED'}
 
+    def apply_evaluated(self, obj, depsgraph, mod_names):
+        """Swap an object's mesh for its evaluated result and drop the baked modifiers, carrying shape keys along"""
+        if obj.evaluated_get(depsgraph) is obj:
+            raise RuntimeError("object is not evaluated")
+
+        old_mesh = obj.data
+        old_key = old_mesh.shape_keys
+        key_coords = None
+
+        if old_key:
+            show_only, active_index = obj.show_only_shape_key, obj.active_shape_key_index
+            obj.show_only_shape_key = True
+            try:
+                key_coords = evaluate_shape_keys(obj, depsgraph)
+                if key_coords is None:
+                    self.report({'WARNING'}, f"{obj.name}: Modifiers change the vertex count, shape keys can't be kept. Skipping.")
+                    return 0
+
+                # Leave the basis active so the new mesh is built from it
+                obj.active_shape_key_index = 0
+                depsgraph.update()
+                new_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+            finally:
+                obj.show_only_shape_key, obj.active_shape_key_index = show_only, active_index
+        else:
+            new_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+
+        obj.data = new_mesh
+        for name in mod_names:
+            obj.modifiers.remove(obj.modifiers[name])
+
+        if key_coords is not None:
+            restore_shape_keys(obj, old_key, key_coords)
+            obj.active_shape_key_index = min(active_index, len(new_mesh.shape_keys.key_blocks) - 1)
+
+        # Linked duplicates keep the old mesh, otherwise the new one takes over its name
+        mesh_name = old_mesh.name
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+            new_mesh.name = mesh_name
+
+        return len(mod_names)
+
 # --------------------------------------------------------------------------------------------------------------
     
 class CheckShapeKeyCount(bpy.types.Operator):
@@ -543,7 +1480,7 @@ class CheckShapeKeyCount(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.data.shape_keys and obj.data.shape_keys.key_blocks for obj in context.selected_objects)
+        return get_selection_summary(context)['shape_keys']
 
     def execute(self, context):
         active_object = context.active_object
@@ -564,9 +1501,25 @@ class FlipUVHorizontallyOperator(bpy.types.Operator):
     bl_label = "Flip UV Maps Horizontally"
     bl_options = {'REGISTER', 'UNDO'}
 
+    all_layers: bpy.props.BoolProperty(
+        name="All UV Maps",
+        description="Flip every UV map instead of only the active one",
+        default=False
+    ) # type: ignore
+
+    pivot: bpy.props.EnumProperty(
+        name="Pivot",
+        items=[
+            ('UNIT', "UV Space Center", "Mirror around the center of the 0-1 UV space"),
+            ('BOUNDS', "Bounds Center", "Mirror around the center of each UV map's bounds, keeping it in place"),
+            ('ISLANDS', "Island Centers", "Mirror each UV island around its own center, keeping every island in place"),
+        ],
+        default='UNIT'
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.data.uv_layers for obj in context.selected_objects)
+        return get_selection_summary(context)['uv_layers']
 
     def execute(self, context):
         selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
@@ -580,15 +1533,8 @@ class FlipUVHorizontallyOperator(bpy.types.Operator):
         if original_mode == 'EDIT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
-        for obj in selected_objects:
-            mesh = obj.data
-            if not mesh.uv_layers:
-                continue
-
-            uv_layer = mesh.uv_layers.active.data
-
-            for uv in uv_layer:
-                uv.uv.x = 1.0 - uv.uv.x
+        # Linked duplicates share their UVs, so each mesh is only flipped once
+        transform_uvs(unique_meshes(selected_objects), UV_FLIP_HORIZONTAL, self.pivot, self.all_layers)
 
         # Switch back to Edit Mode if it was active
         if original_mode == 'EDIT':
@@ -608,9 +1554,25 @@ class FlipUVVerticallyOperator(bpy.types.Operator):
     bl_label = "Flip UV Maps Vertically"
     bl_options = {'REGISTER', 'UNDO'}
 
+    all_layers: bpy.props.BoolProperty(
+        name="All UV Maps",
+        description="Flip every UV map instead of only the active one",
+        default=False
+    ) # type: ignore
+
+    pivot: bpy.props.EnumProperty(
+        name="Pivot",
+        items=[
+            ('UNIT', "UV Space Center", "Mirror around the center of the 0-1 UV space"),
+            ('BOUNDS', "Bounds Center", "Mirror around the center of each UV map's bounds, keeping it in place"),
+            ('ISLANDS', "Island Centers", "Mirror each UV island around its own center, keeping every island in place"),
+        ],
+        default='UNIT'
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' and obj.data.uv_layers for obj in context.selected_objects)
+        return get_selection_summary(context)['uv_layers']
 
     def execute(self, context):
         selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
@@ -624,15 +1586,8 @@ class FlipUVVerticallyOperator(bpy.types.Operator):
         if original_mode == 'EDIT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
-        for obj in selected_objects:
-            mesh = obj.data
-            if not mesh.uv_layers:
-                continue
-
-            uv_layer = mesh.uv_layers.active.data
-
-            for uv in uv_layer:
-                uv.uv.y = 1.0 - uv.uv.y
+        # Linked duplicates share their UVs, so each mesh is only flipped once
+        transform_uvs(unique_meshes(selected_objects), UV_FLIP_VERTICAL, self.pivot, self.all_layers)
 
         # Switch back to Edit Mode if it was active
         if original_mode == 'EDIT':
@@ -647,14 +1602,14 @@ class FlipUVVerticallyOperator(bpy.types.Operator):
 # --------------------------------------------------------------------------------------------------------------
 
 class BatchAddVertexColorOperator(bpy.types.Operator):
-    """Add a Face Corner Byte Color attribute with a custom color and name to all selected objects"""
+    """Add a Color attribute with a custom color and name to all selected objects"""
     bl_idname = "object.batch_add_vertex_color"
     bl_label = "Quickly Add Custom Vertex Colors"
     bl_options = {'REGISTER', 'UNDO'}
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' for obj in context.selected_objects)
+        return get_selection_summary(context)['meshes']
 
     # Property for the custom color (RGBA)
     custom_color: bpy.props.FloatVectorProperty(
@@ -673,6 +1628,24 @@ class BatchAddVertexColorOperator(bpy.types.Operator):
         description="Name of the new vertex color attribute"
     ) # type: ignore
 
+    data_type: bpy.props.EnumProperty(
+        name="Data Type",
+        items=[
+            ('BYTE_COLOR', "Byte Color", "8 bits per channel, 4 bytes per element"),
+            ('FLOAT_COLOR', "Float Color", "32 bits per channel, 16 bytes per element"),
+        ],
+        default='BYTE_COLOR'
+    ) # type: ignore
+
+    domain: bpy.props.EnumProperty(
+        name="Domain",
+        items=[
+            ('CORNER', "Face Corner", "One color per face corner"),
+            ('POINT', "Vertex", "One color per vertex, usually several times smaller"),
+        ],
+        default='CORNER'
+    ) # type: ignore
+
     def invoke(self, context, event):
         # Open the dialog for user input
         return context.window_manager.invoke_props_dialog(self)
@@ -682,30 +1655,39 @@ class BatchAddVertexColorOperator(bpy.types.Operator):
         layout.prop(self, "color_name", text="Vertex Color Name")  # Input field for the attribute name
         layout.prop(self, "custom_color", text="Color Picker")     # Color picker field
 
+        row = layout.row()
+        row.prop(self, "domain", expand=True)
+        row = layout.row()
+        row.prop(self, "data_type", expand=True)
+
     def execute(self, context):
-        selected_objects = context.selected_objects
+        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
         processed_objects = []
 
-        # Convert the custom color to Byte format (0-255)
-        color_byte = tuple(int(channel * 255) for channel in self.custom_color)
+        # One pre-tiled fill buffer per element count, shared by every mesh of that size
+        fill_buffers = {}
+        color = np.array(self.custom_color, dtype=np.float32)
 
-        for obj in selected_objects:
-            if obj.type == 'MESH':
-                mesh = obj.data
+        # Color attributes live on the mesh, so linked duplicates are only filled once
+        for obj in unique_mesh_objects(selected_objects):
+            mesh = obj.data
 
-                # Check if a color attribute with the same name already exists
-                if self.color_name in mesh.attributes:
-                    self.report({'WARNING'}, f"'{obj.name}' already has a vertex color named '{self.color_name}'. Skipping.")
-                    continue
+            # Check if a color attribute with the same name already exists
+            if self.color_name in mesh.attributes:
+                self.report({'WARNING'}, f"'{obj.name}' already has a vertex color named '{self.color_name}'. Skipping.")
+                continue
 
-                # Create a new Byte Color attribute with the specified name
-                color_layer = mesh.attributes.new(name=self.color_name, type='BYTE_COLOR', domain='CORNER')
+            # Create a new color attribute with the specified name, type and domain
+            color_layer = mesh.attributes.new(name=self.color_name, type=self.data_type, domain=self.domain)
 
-                # Fill the color attribute with the custom color
-                for corner_color in color_layer.data:
-                    corner_color.color = color_byte
+            # Fill the color attribute with the custom color in one call
+            count = len(color_layer.data)
+            fill = fill_buffers.get(count)
+            if fill is None:
+                fill = fill_buffers[count] = np.tile(color, count)
+            color_layer.data.foreach_set("color", fill)
 
-                processed_objects.append(obj.name)
+            processed_objects.append(obj.name)
 
         if processed_objects:
             self.report({'INFO'}, f"Vertex Color '{self.color_name}' added to {len(processed_objects)} object(s): {', '.join(processed_objects)}")
@@ -720,9 +1702,43 @@ def get_shape_keys(self, context):
     """Dynamically fetch shape keys when the operator is invoked."""
     obj = context.object
     if obj and obj.type == 'MESH' and obj.data.shape_keys:
-        return [(key.name, key.name, "") for key in obj.data.shape_keys.key_blocks if key.name != "Basis"]
+        shape_keys = obj.data.shape_keys
+        return cached_enum_items("shape_keys", shape_keys, lambda: [(key.name, key.name, "") for key in shape_keys.key_blocks if key.name != "Basis"],
+                                 signature=(len(shape_keys.key_blocks), obj.active_shape_key_index))
     return [("NONE", "No Shape Keys", "No shape keys available")]
 
+def shape_key_delta_colors(basis_coords, key_coords, displacement_value):
+    """Map per-vertex shape key deltas to (N, 4) RGBA colors, neutral gray where the key doesn't move the vertex"""
+    deltas = key_coords - basis_coords
+
+    # Normalize XYZ vectors from (-max, +max) to (0, 1)
+    colors = np.empty((len(deltas), 4), dtype=np.float32)
+    colors[:, :3] = np.clip(((deltas / displacement_value) / 2) + 0.5, 0.0, 1.0)
+    colors[:, 3] = 1.0
+
+    # Areas with no morphing get #808080 (mid gray)
+    colors[np.all(np.abs(deltas) <= 1e-6, axis=1)] = (0.5, 0.5, 0.5, 1.0)
+    return colors
+
+def bake_shape_key_color(mesh, key, basis_coords, displacement_value, buffer=None):
+    """Write a shape key's deltas into a POINT color attribute named '<key>_Vectors' and return that name"""
+    key_coords = read_flat_array(key.data, "co", 3, buffer)
+    colors = shape_key_delta_colors(basis_coords, key_coords, displacement_value)
+
+    # Name the vertex color layer after the shape key
+    color_layer_name = f"{key.name}_Vectors"
+
+    # Ensure a per-vertex color layer exists
+    color_layer = mesh.color_attributes.get(color_layer_name)
+    if color_layer and color_layer.domain != 'POINT':
+        mesh.color_attributes.remove(color_layer)
+        color_layer = None
+    if not color_layer:
+        color_layer = mesh.color_attributes.new(name=color_layer_name, type='BYTE_COLOR', domain='POINT')
+
+    color_layer.data.foreach_set("color", colors.reshape(-1))
+    return color_layer_name
+
 class ProjectShapeKeyToVertexColorOperator(bpy.types.Operator):
     """Project a Shape Key's delta data into a Vertex Color Attribute"""
     bl_idname = "object.project_key_to_color"
@@ -742,6 +1758,12 @@ class ProjectShapeKeyToVertexColorOperator(bpy.types.Operator):
         min=0.001,  # Prevents division by zero
     ) # type: ignore
 
+    bake_all: bpy.props.BoolProperty(
+        name="All Shape Keys on Selected",
+        description="Bake every non-basis shape key of every selected mesh into its own vertex color attribute",
+        default=False
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
         return context.object and context.object.type == 'MESH' and context.object.data.shape_keys
@@ -759,11 +1781,19 @@ class ProjectShapeKeyToVertexColorOperator(bpy.types.Operator):
     def draw(self, context):
         """Draw dropdown menu for shape key selection"""
         layout = self.layout
-        layout.prop(self, "shape_key_name", text="Shape Key")
+        layout.prop(self, "bake_all")
+
+        row = layout.row()
+        row.enabled = not self.bake_all
+        row.prop(self, "shape_key_name", text="Shape Key")
+
         layout.prop(self, "displacement_value")
 
     def execute(self, context):
         """Runs the conversion from shape key to vertex color"""
+        if self.bake_all:
+            return self.bake_all_shape_keys(context)
+
         obj = context.object
         if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
             self.report({'ERROR'}, "No valid mesh object with shape keys selected.")
@@ -776,44 +1806,40 @@ class ProjectShapeKeyToVertexColorOperator(bpy.types.Operator):
         self.shape_key_to_vector_color(obj, self.shape_key_name, self.displacement_value)
         return {'FINISHED'}
 
-    def shape_key_to_vector_color(self, obj, shape_key_name, displacement_value):
-        """
-        Converts the raw delta vector data of a shape key into a vertex color map (RGB visualization).
-        Areas with no morphing will be colored in #808080 (neutral gray).
-        """
-
-        shape_keys = obj.data.shape_keys.key_blocks
-        basis_key = shape_keys["Basis"]
-        target_key = shape_keys[shape_key_name]
+    def bake_all_shape_keys(self, context):
+        """Bake every non-basis shape key of every selected mesh, reading each basis only once"""
+        meshes = unique_meshes(obj for obj in context.selected_objects if obj.type == 'MESH' and obj.data.shape_keys)
+        if not meshes:
+            self.report({'ERROR'}, "No selected mesh objects with shape keys.")
+            return {'CANCELLED'}
 
-        # Get vertex positions from both shape keys
-        basis_vertices = np.array([v.co for v in basis_key.data])
-        target_vertices = np.array([v.co for v in target_key.data])
+        baked_count = 0
+        for mesh in meshes:
+            basis_key = mesh.shape_keys.reference_key
+            basis_coords = read_flat_array(basis_key.data, "co", 3).copy()
+            buffer = np.empty(basis_coords.size, dtype=np.float32)
 
-        # Compute raw delta vectors per vertex
-        deltas = target_vertices - basis_vertices
+            for key in mesh.shape_keys.key_blocks:
+                if key == basis_key:
+                    continue
+                bake_shape_key_color(mesh, key, basis_coords, self.displacement_value, buffer)
+                baked_count += 1
 
-        # Normalize XYZ vectors from (-max, +max) to (0, 1)
-        normalized_deltas = (((deltas / displacement_value) / 2) + 0.5)
+            mesh.update()
 
-        # Define the hex color #808080 (mid gray) as RGB (0–1 range)
-        no_morph_color = (0.5, 0.5, 0.5, 1.0)
+        self.report({'INFO'}, f"Baked {baked_count} shape keys into vertex colors across {len(meshes)} meshes.")
+        return {'FINISHED'}
 
-        # Name the vertex color layer after the shape key
-        color_layer_name = f"{shape_key_name}_Vectors"
+    def shape_key_to_vector_color(self, obj, shape_key_name, displacement_value):
+        """
+        Converts the raw delta vector data of a shape key into a vertex color map (RGB visualization).
+        Areas with no morphing will be colored in #808080 (neutral gray).
+        """
 
-        # Ensure a vertex color layer exists
-        color_layer = obj.data.color_attributes.get(color_layer_name)
-        if not color_layer:
-            color_layer = obj.data.color_attributes.new(name=color_layer_name, type='BYTE_COLOR', domain='POINT')
+        shape_keys = obj.data.shape_keys
+        basis_coords = read_flat_array(shape_keys.reference_key.data, "co", 3)
 
-        # Assign the raw vector displacement to vertex colors
-        for i, color in enumerate(color_layer.data):
-            r, g, b = normalized_deltas[i]
-            if np.allclose(deltas[i], 0, atol=1e-6):
-                color.color = no_morph_color
-            else:
-                color.color = (r, g, b, 1.0)
+        color_layer_name = bake_shape_key_color(obj.data, shape_keys.key_blocks[shape_key_name], basis_coords, displacement_value)
 
         # Update mesh to reflect changes
         obj.data.update()
@@ -823,12 +1849,38 @@ class ProjectShapeKeyToVertexColorOperator(bpy.types.Operator):
 # --------------------------------------------------------------------------------------------------------------
 
 def get_vertex_color_layers(self, context):
-    """Fetch available vertex color layers dynamically using vertex_colors."""
+    """Fetch available color attributes (per-vertex or per-corner) dynamically."""
     obj = context.object
-    if obj and obj.type == 'MESH' and obj.data.vertex_colors:
-        return [(layer.name, layer.name, "") for layer in obj.data.vertex_colors]
+    if obj and obj.type == 'MESH':
+        mesh = obj.data
+        layers = cached_enum_items("color_layers", mesh, lambda: [
+            (layer.name, layer.name, f"{layer.domain.title()} {layer.data_type.replace('_', ' ').title()}")
+            for layer in mesh.color_attributes if layer.domain in {'POINT', 'CORNER'}
+        ], signature=(len(mesh.color_attributes), mesh.color_attributes.active_color_index))
+        if layers:
+            return layers
     return [("NONE", "No Vertex Colors", "No vertex color layers available")]
 
+def color_offsets_per_vertex(mesh, color_attr):
+    """Average a color attribute's RGB around mid gray per vertex, returning (N, 3) offsets and per-vertex sample counts"""
+    vertex_count = len(mesh.vertices)
+
+    # color_srgb matches the values the legacy vertex_colors API used to return
+    colors = read_flat_array(color_attr.data, "color_srgb", 4)
+    offsets = colors[:, :3] - 0.5
+
+    if color_attr.domain == 'POINT':
+        return offsets, np.ones(vertex_count, dtype=np.int64)
+
+    # Face corner colors are averaged onto their vertices with one bincount per channel
+    vertex_index = read_flat_array(mesh.loops, "vertex_index", 1, dtype=np.int32)
+    counts = np.bincount(vertex_index, minlength=vertex_count)
+    sums = np.empty((vertex_count, 3), dtype=np.float64)
+    for channel in range(3):
+        sums[:, channel] = np.bincount(vertex_index, weights=offsets[:, channel], minlength=vertex_count)
+
+    return sums / np.maximum(counts, 1)[:, None], counts
+
 class ProjectVertexColorToShapeKeyOperator(bpy.types.Operator):
     """Project a Vertex Color Attribute to a Shape Key"""
     bl_idname = "object.project_color_to_key"
@@ -850,7 +1902,7 @@ class ProjectVertexColorToShapeKeyOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.object and context.object.type == 'MESH' and context.object.data.vertex_colors
+        return context.object and context.object.type == 'MESH' and any(layer.domain in {'POINT', 'CORNER'} for layer in context.object.data.color_attributes)
 
     def invoke(self, context, event):
         """Show the UI dialog before executing"""
@@ -880,9 +1932,9 @@ class ProjectVertexColorToShapeKeyOperator(bpy.types.Operator):
         """Converts vertex colors to shape key offsets"""
         mesh = obj.data
 
-        # Fetch selected vertex color layer
-        vcol_layer = mesh.vertex_colors.get(color_layer_name)
-        if not vcol_layer:
+        # Fetch selected color attribute
+        color_attr = mesh.color_attributes.get(color_layer_name)
+        if not color_attr or color_attr.domain not in {'POINT', 'CORNER'}:
             self.report({'WARNING'}, f"Vertex color layer '{color_layer_name}' not found.")
             return False, None, None
 
@@ -894,29 +1946,15 @@ class ProjectVertexColorToShapeKeyOperator(bpy.types.Operator):
         morph_key_name = f"{color_layer_name}_Morph"
         morph_key = obj.shape_key_add(name=morph_key_name)
 
-        # Prepare data storage
-        vertex_colors = {i: Vector((0, 0, 0)) for i in range(len(mesh.vertices))}
-        vertex_counts = {i: 0 for i in range(len(mesh.vertices))}
-
-        # Loop through loops to collect vertex color data
-        color_data = vcol_layer.data
-        for loop in mesh.loops:
-            vert_index = loop.vertex_index
-            color = color_data[loop.index].color  # Get (R, G, B, A)
-
-            # Convert RGB to displacement offset
-            offset = Vector((color[0] - 0.5, color[1] - 0.5, color[2] - 0.5))
-
-            # Accumulate per vertex
-            vertex_colors[vert_index] += offset
-            vertex_counts[vert_index] += 1
+        # Average the color offsets per vertex in bulk
+        offsets, counts = color_offsets_per_vertex(mesh, color_attr)
 
-        # Apply average displacement to each vertex
-        for vert in mesh.vertices:
-            if vertex_counts[vert.index] > 0:
-                avg_offset = vertex_colors[vert.index] / vertex_counts[vert.index]
-                new_position = vert.co + (avg_offset * 2 * displacement_value)
-                morph_key.data[vert.index].co = new_position
+        # Apply average displacement to each vertex that has color samples
+        vertex_coords = read_flat_array(mesh.vertices, "co", 3)
+        morph_coords = read_flat_array(morph_key.data, "co", 3)
+        has_samples = counts > 0
+        morph_coords[has_samples] = vertex_coords[has_samples] + (offsets[has_samples] * 2 * displacement_value)
+        morph_key.data.foreach_set("co", morph_coords.reshape(-1))
 
         return True, color_layer_name, morph_key.name
 
@@ -928,37 +1966,77 @@ class ConvertTrisToQuadsOperator(bpy.types.Operator):
     bl_label = "Batch Convert Triangles to Quads"
     bl_options = {'REGISTER', 'UNDO'}
 
+    compare_uvs: bpy.props.BoolProperty(
+        name="Compare UVs",
+        description="Don't join triangles across UV seams",
+        default=True
+    ) # type: ignore
+
+    face_threshold: bpy.props.FloatProperty(
+        name="Max Face Angle",
+        description="Maximum angle between the face normals of the triangles to join",
+        subtype='ANGLE',
+        default=math.radians(180),
+        min=0.0,
+        max=math.radians(180)
+    ) # type: ignore
+
+    shape_threshold: bpy.props.FloatProperty(
+        name="Max Shape Angle",
+        description="Maximum shape difference of the resulting quad",
+        subtype='ANGLE',
+        default=math.radians(180),
+        min=0.0,
+        max=math.radians(180)
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
         """Ensure at least one selected mesh exists"""
-        return context.selected_objects and any(obj.type == 'MESH' for obj in context.selected_objects)
+        return get_selection_summary(context)['meshes']
 
     def execute(self, context):
         """Convert triangles to quads on all selected mesh objects"""
-        converted_objects = 0
-
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                # Switch to Edit Mode
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-
-                # Select all faces
-                bpy.ops.mesh.select_all(action='SELECT')
-
-                # Run Tris to Quads with "Compare UVs" enabled
-                bpy.ops.mesh.tris_convert_to_quads(uvs=True, face_threshold=180, shape_threshold=180)
-
-                # Return to Object Mode
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                converted_objects += 1
+        # Mesh data is stale while an object is in Edit Mode
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        if converted_objects > 0:
-            if converted_objects == 1:
-                self.report({'INFO'}, f"Converted triangles to quads in '{context.active_object.name}'.")
+        meshes = unique_meshes(context.selected_objects)
+        converted_meshes = 0
+        joined_faces = 0
+
+        # Work on each mesh's data directly, linked duplicates are only converted once
+        bm = bmesh.new()
+        try:
+            for mesh in meshes:
+                bm.from_mesh(mesh)
+                face_count = len(bm.faces)
+
+                triangles = [f for f in bm.faces if len(f.verts) == 3]
+                if triangles:
+                    bmesh.ops.join_triangles(
+                        bm,
+                        faces=triangles,
+                        cmp_uvs=self.compare_uvs,
+                        angle_face_threshold=self.face_threshold,
+                        angle_shape_threshold=self.shape_threshold,
+                    )
+
+                if len(bm.faces) != face_count:
+                    bm.to_mesh(mesh)
+                    mesh.update()
+                    joined_faces += face_count - len(bm.faces)
+                    converted_meshes += 1
+
+                bm.clear()
+        finally:
+            bm.free()
+
+        if converted_meshes > 0:
+            if converted_meshes == 1:
+                self.report({'INFO'}, f"Converted triangles to quads in 1 mesh ({joined_faces} quads made).")
             else:
-                self.report({'INFO'}, f"Converted triangles to quads in {converted_objects} objects.")
+                self.report({'INFO'}, f"Converted triangles to quads in {converted_meshes} meshes ({joined_faces} quads made).")
         else:
             self.report({'WARNING'}, "No valid meshes with triangles found.")
 
@@ -966,6 +2044,84 @@ class ConvertTrisToQuadsOperator(bpy.types.Operator):
 
 # --------------------------------------------------------------------------------------------------------------
 
+# Bone hierarchies per armature datablock, rebuilt whenever a bone is renamed or reparented
+BONE_HIERARCHY_CACHE = {}
+
+def get_bone_hierarchy(armature):
+    """Parent index, depth and topological order arrays for an armature's bones, cached per armature"""
+    bones = armature.bones
+    names = bones.keys()
+    parent_names = tuple(b.parent.name if b.parent else "" for b in bones)
+    key = armature.as_pointer()
+
+    cached = BONE_HIERARCHY_CACHE.get(key)
+    if cached and cached['names'] == names and cached['parent_names'] == parent_names:
+        return cached
+
+    # Forget armatures that were deleted since they were cached
+    if len(BONE_HIERARCHY_CACHE) >= len(bpy.data.armatures):
+        alive = {arm.as_pointer() for arm in bpy.data.armatures}
+        for stale in [k for k in BONE_HIERARCHY_CACHE if k not in alive]:
+            del BONE_HIERARCHY_CACHE[stale]
+
+    index = {name: i for i, name in enumerate(names)}
+    parents = np.array([index[name] if name else -1 for name in parent_names], dtype=np.int32)
+
+    # Walk every chain up one level at a time, all bones at once
+    depth = np.zeros(len(names), dtype=np.int32)
+    ancestors = parents.copy()
+    while (ancestors >= 0).any():
+        has_parent = ancestors >= 0
+        depth[has_parent] += 1
+        ancestors[has_parent] = parents[ancestors[has_parent]]
+
+    # Stable sort by depth puts every parent before its children
+    order = np.argsort(depth, kind='stable').astype(np.int32)
+    level_sizes = np.bincount(depth) if len(depth) else np.zeros(0, dtype=np.int64)
+
+    hierarchy = {
+        'names': names,
+        'parent_names': parent_names,
+        'index': index,
+        'parents': parents,
+        'depth': depth,
+        'order': order,
+        'levels': np.split(order, np.cumsum(level_sizes)[:-1]) if len(order) else [],
+    }
+    BONE_HIERARCHY_CACHE[key] = hierarchy
+    return hierarchy
+
+def shared_bone_roots(hierarchy, other_names):
+    """Mask the bones whose names also exist in 'other_names', and the shared bones with no shared ancestor"""
+    shared = np.fromiter((name in other_names for name in hierarchy['names']), dtype=bool, count=len(hierarchy['names']))
+    parents = hierarchy['parents']
+
+    # One pass down the hierarchy, level by level, marks the bones below a shared bone
+    covered = np.zeros_like(shared)
+    for level in hierarchy['levels'][1:]:
+        level_parents = parents[level]
+        covered[level] = shared[level_parents] | covered[level_parents]
+
+    return shared, shared & ~covered
+
+def build_armature_dependents(objects=None):
+    """Index in one pass which meshes each armature drives, through parenting or an Armature modifier: {armature: [meshes]}"""
+    dependents = {}
+    for obj in (bpy.data.objects if objects is None else objects):
+        if obj.type != 'MESH':
+            continue
+
+        armatures = []
+        if obj.parent and obj.parent.type == 'ARMATURE':
+            armatures.append(obj.parent)
+        for m in obj.modifiers:
+            if m.type == 'ARMATURE' and m.object and m.object not in armatures:
+                armatures.append(m.object)
+
+        for arm in armatures:
+            dependents.setdefault(arm, []).append(obj)
+    return dependents
+
 class ArmatureMergeItem(bpy.types.PropertyGroup):
     """Helper to store armature names and selection states in the UI"""
     name: StringProperty() # type: ignore
@@ -979,8 +2135,8 @@ class MergeArmaturesOperator(bpy.types.Operator):
 
 # Source selection dropdown
     def enum_source(self, context):
-        return [(o.name, o.name, f"Base: {o.name}") 
-                for o in bpy.data.objects if o.type == 'ARMATURE']
+        return cached_enum_items("merge_source", None, lambda: [(o.name, o.name, f"Base: {o.name}") 
+                                                                for o in bpy.data.objects if o.type == 'ARMATURE'])
 
     source_name: EnumProperty(
         name="Source Armature",
@@ -1060,6 +2216,8 @@ class MergeArmaturesOperator(bpy.types.Operator):
         total_meshes = 0
 
         # 3. Process the Target Armature (Merge bones and retarget meshes)
+        bone_data = {}
+        corrections = []
         for donor_obj in donor_objs:
             if not donor_obj: continue
 
@@ -1067,16 +2225,18 @@ class MergeArmaturesOperator(bpy.types.Operator):
             stitch_name = self.find_stitch_bone(donor_obj, target_obj)
             c_mat = self.get_correction_matrix(donor_obj, target_obj, stitch_name)
 
-            # Merge bones
-            b_data = self.get_edit_data(donor_obj, c_mat)
-            total_bones += self.perform_merge(merged_obj, b_data)
+            # Collect bones, earlier donors win when several carry the same bone
+            for name, d in self.get_bone_data(donor_obj, c_mat).items():
+                bone_data.setdefault(name, d)
+            corrections.append((donor_obj, c_mat))
 
-            # Retarget the new meshes
-            total_meshes += self.retarget_meshes(donor_obj, merged_obj, c_mat)
+        # Merge every donor's bones in a single Edit Mode session
+        total_bones += self.perform_merge(merged_obj, bone_data)
 
-        # 4. Process the Base (Retarget the foundation's own meshes)
+        # 4. Retarget the donors' meshes and the base's own meshes in one sweep
         # For the base meshes, the correction matrix is just Identity (no movement)
-        total_meshes += self.retarget_meshes(target_obj, merged_obj, Matrix.Identity(4))
+        corrections.append((target_obj, Matrix.Identity(4)))
+        total_meshes += self.retarget_meshes(corrections, merged_obj, build_armature_dependents())
 
         # 5. SURGICAL CLEANUP (Remove the old rigs)
         # We delete the data-blocks as well to prevent ".001" clutter later
@@ -1091,16 +2251,11 @@ class MergeArmaturesOperator(bpy.types.Operator):
 
     # --- INTERNAL HELPERS ---
     def find_stitch_bone(self, source, target):
-        for b in source.data.bones:
-            if b.name in target.data.bones:
-                curr, is_root = b.parent, True
-                while curr:
-                    if curr.name in target.data.bones:
-                        is_root = False
-                        break
-                    curr = curr.parent
-                if is_root: return b.name
-        return None
+        # The first shared bone without a shared ancestor is where the donor joins the base
+        hierarchy = get_bone_hierarchy(source.data)
+        shared, roots = shared_bone_roots(hierarchy, set(target.data.bones.keys()))
+        root_indices = np.flatnonzero(roots)
+        return hierarchy['names'][root_indices[0]] if len(root_indices) else None
 
     def get_correction_matrix(self, source, target, bone_name):
         if not bone_name: return Matrix.Identity(4)
@@ -1108,21 +2263,24 @@ class MergeArmaturesOperator(bpy.types.Operator):
         t_m = target.matrix_world @ target.data.bones[bone_name].matrix_local
         return t_m @ s_m.inverted()
 
-    def get_edit_data(self, obj, c_mat):
-        # Briefly enter Edit Mode on source to grab original bone data
+    def get_bone_data(self, obj, c_mat):
+        # Read the rest data straight from the bones, the donor never enters Edit Mode
         data = {}
-        old_mode = obj.mode
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='EDIT')
-        for eb in obj.data.edit_bones:
-            data[eb.name] = {
-                'head': c_mat @ (obj.matrix_world @ eb.head),
-                'tail': c_mat @ (obj.matrix_world @ eb.tail),
-                'roll': eb.roll,
-                'parent': eb.parent.name if eb.parent else None,
-                'use_connect': eb.use_connect
+        w_mat = c_mat @ obj.matrix_world
+        bones = obj.data.bones.values()
+        hierarchy = get_bone_hierarchy(obj.data)
+        names, parents = hierarchy['names'], hierarchy['parents']
+
+        # Topological order, so parents always come before their children
+        for i in hierarchy['order']:
+            b = bones[i]
+            data[b.name] = {
+                'head': w_mat @ b.head_local,
+                'tail': w_mat @ b.tail_local,
+                'roll': bpy.types.Bone.AxisRollFromMatrix(b.matrix_local.to_3x3())[1],
+                'parent': names[parents[i]] if parents[i] >= 0 else None,
+                'use_connect': b.use_connect
             }
-        bpy.ops.object.mode_set(mode=old_mode)
         return data
 
     def perform_merge(self, target, data):
@@ -1146,46 +2304,238 @@ class MergeArmaturesOperator(bpy.types.Operator):
         bpy.ops.object.mode_set(mode='OBJECT')
         return len(added)
 
-    def retarget_meshes(self, source, target, c_mat):
-        count = 0
-        # Iterate over all meshes in the file
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH': continue
+    def retarget_meshes(self, sources, target, dependents):
+        # Each mesh moves once, with the correction of the first armature in 'sources' that drives it
+        moves = {}
+        for source, c_mat in sources:
+            for obj in dependents.get(source, ()):
+                moves.setdefault(obj, c_mat)
+
+        replaced = {source for source, _ in sources}
+        for obj, c_mat in moves.items():
+            # Store world position
+            w_mat = obj.matrix_world.copy()
             
-            # Check if this mesh is parented to the source OR has a modifier pointing to it
-            is_parented = (obj.parent == source)
-            arm_mod = next((m for m in obj.modifiers if m.type == 'ARMATURE' and m.object == source), None)
+            # Switch parent to the new rig
+            obj.parent = target
             
-            if is_parented or arm_mod:
-                # Store world position
-                w_mat = obj.matrix_world.copy()
-                
-                # Switch parent to the new rig
-                obj.parent = target
-                
-                # Apply the correction (for base meshes, c_mat is Identity, so they stay put)
-                obj.matrix_world = c_mat @ w_mat
-                
-                # Update all Armature modifiers on this mesh
-                for m in obj.modifiers:
-                    if m.type == 'ARMATURE' and (m.object == source or m.object is None):
-                        m.object = target
-                count += 1
-        return count
+            # Apply the correction (for base meshes, c_mat is Identity, so they stay put)
+            obj.matrix_world = c_mat @ w_mat
+            
+            # Update all Armature modifiers on this mesh
+            for m in obj.modifiers:
+                if m.type == 'ARMATURE' and (m.object in replaced or m.object is None):
+                    m.object = target
+        return len(moves)
     
 # --------------------------------------------------------------------------------------------------------------
 
 def enum_armatures(self, context):
-    objs = (context.scene.objects if context else bpy.data.objects)
-    return [(o.name, o.name, "") for o in objs if o.type == 'ARMATURE']
-
-def matrices_equals(mat1, mat2, epsilon=0.0001):
-    # Element-wise comparison
-    for i in range(4):
-        for j in range(4):
-            if abs(mat1[i][j] - mat2[i][j]) >= epsilon:
-                return False
-    return True
+    scene = context.scene if context else None
+    objs = (scene.objects if scene else bpy.data.objects)
+    return cached_enum_items("armatures", scene, lambda: [(o.name, o.name, "") for o in objs if o.type == 'ARMATURE'])
+
+def matrices_equal_mask(mats1, mats2, epsilon=0.0001):
+    # Element-wise comparison of stacked (N, 4, 4) matrices, one skip flag per pair
+    return np.all(np.abs(np.asarray(mats1) - np.asarray(mats2)) < epsilon, axis=(1, 2))
+
+def read_matrices(collection, attr):
+    """Read a 4x4 matrix property of every item with one foreach_get, as row-major (N, 4, 4) float64 arrays"""
+    flat = read_flat_array(collection, attr, 16)
+    # RNA hands matrices out column by column
+    return flat.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+
+def write_matrices(collection, attr, matrices):
+    """Write row-major (N, 4, 4) arrays back to a 4x4 matrix property with one foreach_set"""
+    collection.foreach_set(attr, np.ascontiguousarray(matrices.transpose(0, 2, 1), dtype=np.float32).reshape(-1))
+
+def pose_bone_order(obj):
+    """Map each pose bone of an armature object to its bone's index in the armature hierarchy"""
+    index = get_bone_hierarchy(obj.data)['index']
+    return np.array([index[name] for name in obj.pose.bones.keys()], dtype=np.int32)
+
+def read_pose_matrices(obj, attr):
+    """Read a pose bone matrix property for every bone, reordered to the armature hierarchy's bone order"""
+    pose_matrices = read_matrices(obj.pose.bones, attr)
+    matrices = np.empty_like(pose_matrices)
+    matrices[pose_bone_order(obj)] = pose_matrices
+    return matrices
+
+def decompose_matrices(matrices):
+    """Split (N, 4, 4) matrices into locations, unit rotation matrices and per-axis scales"""
+    location = matrices[:, :3, 3]
+    scale = np.linalg.norm(matrices[:, :3, :3], axis=1)
+    rotation = matrices[:, :3, :3] / np.where(scale > 1e-12, scale, 1.0)[:, None, :]
+    return location, rotation, scale
+
+def solve_retarget_pose(src, tgt, threshold):
+    """
+    Compute every target bone's matrix_basis so the bones shared with the source copy its world location
+    and scale and its pose-space rotation, the same result the temporary Copy constraints used to bake.
+    Returns the (N, 4, 4) basis matrices in hierarchy order, the mask of solved bones and the skipped count.
+    """
+    hierarchy = get_bone_hierarchy(tgt.data)
+    names, parents = hierarchy['names'], hierarchy['parents']
+    bone_count = len(names)
+
+    rest = read_matrices(tgt.data.bones, "matrix_local")
+    basis = read_pose_matrices(tgt, "matrix_basis")
+    pose = read_pose_matrices(tgt, "matrix")
+
+    # Pair every target bone with its source namesake
+    src_index = {name: i for i, name in enumerate(src.pose.bones.keys())}
+    tgt_rows = np.array([i for i, name in enumerate(names) if name in src_index], dtype=np.int32)
+    src_rows = np.array([src_index[names[i]] for i in tgt_rows], dtype=np.int32)
+
+    solve = np.zeros(bone_count, dtype=bool)
+    desired = np.empty((bone_count, 4, 4), dtype=np.float64)
+    skipped = 0
+
+    if len(tgt_rows):
+        src_world = np.array(src.matrix_world, dtype=np.float64)
+        tgt_world = np.array(tgt.matrix_world, dtype=np.float64)
+
+        src_pose = read_matrices(src.pose.bones, "matrix")[src_rows]
+        src_world_pose = src_world @ src_pose
+        tgt_world_pose = tgt_world @ pose[tgt_rows]
+
+        differs = ~matrices_equal_mask(src_world_pose, tgt_world_pose, threshold)
+        skipped = int((~differs).sum())
+        tgt_rows, src_pose, src_world_pose = tgt_rows[differs], src_pose[differs], src_world_pose[differs]
+
+        # World location and scale, pose-space rotation
+        location = (np.linalg.inv(tgt_world) @ src_world_pose)[:, :3, 3]
+        _, rotation, _ = decompose_matrices(src_pose)
+        _, _, world_scale = decompose_matrices(src_world_pose)
+        _, _, object_scale = decompose_matrices(tgt_world[None])
+        scale = world_scale / object_scale
+
+        matrices = np.zeros((len(tgt_rows), 4, 4), dtype=np.float64)
+        matrices[:, :3, :3] = rotation * scale[:, None, :]
+        matrices[:, :3, 3] = location
+        matrices[:, 3, 3] = 1.0
+
+        desired[tgt_rows] = matrices
+        solve[tgt_rows] = True
+
+    # Forward through the hierarchy one depth level at a time, every bone of a level in one batch.
+    # Unsolved bones keep their basis and follow their parent, solved ones get a basis that lands on 'desired'.
+    final = np.empty_like(pose)
+    new_basis = basis.copy()
+    for level in hierarchy['levels']:
+        level_parents = parents[level]
+        offset = rest[level].copy()
+        has_parent = level_parents >= 0
+        if has_parent.any():
+            children, parent_rows = level[has_parent], level_parents[has_parent]
+            offset[has_parent] = final[parent_rows] @ np.linalg.inv(rest[parent_rows]) @ rest[children]
+
+        solved = solve[level]
+        final[level] = offset @ basis[level]
+        if solved.any():
+            rows = level[solved]
+            final[rows] = desired[rows]
+            new_basis[rows] = np.linalg.inv(offset[solved]) @ desired[rows]
+
+    return new_basis, solve, skipped
+
+def compare_poses(src, tgt):
+    """World-space location, rotation (degrees) and scale error of every bone the two rigs share"""
+    src_index = {name: i for i, name in enumerate(src.pose.bones.keys())}
+    tgt_names = tgt.pose.bones.keys()
+    tgt_rows = np.array([i for i, name in enumerate(tgt_names) if name in src_index], dtype=np.int32)
+    src_rows = np.array([src_index[tgt_names[i]] for i in tgt_rows], dtype=np.int32)
+
+    src_world = np.array(src.matrix_world, dtype=np.float64) @ read_matrices(src.pose.bones, "matrix")[src_rows]
+    tgt_world = np.array(tgt.matrix_world, dtype=np.float64) @ read_matrices(tgt.pose.bones, "matrix")[tgt_rows]
+
+    src_loc, src_rot, src_scale = decompose_matrices(src_world)
+    tgt_loc, tgt_rot, tgt_scale = decompose_matrices(tgt_world)
+
+    # Angle of the relative rotation, from its trace
+    relative = np.einsum('nji,njk->nik', src_rot, tgt_rot)
+    cos_angle = np.clip((np.trace(relative, axis1=1, axis2=2) - 1.0) / 2.0, -1.0, 1.0)
+
+    return {
+        'names': [tgt_names[i] for i in tgt_rows],
+        'src_world': src_world,
+        'tgt_world': tgt_world,
+        'location': np.linalg.norm(src_loc - tgt_loc, axis=1),
+        'rotation': np.degrees(np.arccos(cos_angle)),
+        'scale': np.abs(src_scale - tgt_scale).max(axis=1),
+    }
+
+def write_pose_basis(obj, basis):
+    """Write matrix_basis for every pose bone in one pass from hierarchy-ordered matrices"""
+    write_matrices(obj.pose.bones, "matrix_basis", basis[pose_bone_order(obj)])
+
+def rotation_matrices_to_quaternions(rotation):
+    """Convert (N, 3, 3) unit rotation matrices to (N, 4) WXYZ quaternions in one vectorized pass"""
+    m = rotation
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+    quats = np.empty((len(m), 4), dtype=np.float64)
+
+    # Pick the numerically safest formula per matrix (largest diagonal term)
+    case_w = trace > 0
+    case_x = ~case_w & (m[:, 0, 0] >= m[:, 1, 1]) & (m[:, 0, 0] >= m[:, 2, 2])
+    case_y = ~case_w & ~case_x & (m[:, 1, 1] >= m[:, 2, 2])
+    case_z = ~(case_w | case_x | case_y)
+
+    r = m[case_w]
+    t = np.sqrt(1.0 + trace[case_w]) * 2
+    quats[case_w] = np.stack([0.25 * t, (r[:, 2, 1] - r[:, 1, 2]) / t, (r[:, 0, 2] - r[:, 2, 0]) / t, (r[:, 1, 0] - r[:, 0, 1]) / t], axis=1)
+
+    r = m[case_x]
+    t = np.sqrt(1.0 + r[:, 0, 0] - r[:, 1, 1] - r[:, 2, 2]) * 2
+    quats[case_x] = np.stack([(r[:, 2, 1] - r[:, 1, 2]) / t, 0.25 * t, (r[:, 0, 1] + r[:, 1, 0]) / t, (r[:, 0, 2] + r[:, 2, 0]) / t], axis=1)
+
+    r = m[case_y]
+    t = np.sqrt(1.0 + r[:, 1, 1] - r[:, 0, 0] - r[:, 2, 2]) * 2
+    quats[case_y] = np.stack([(r[:, 0, 2] - r[:, 2, 0]) / t, (r[:, 0, 1] + r[:, 1, 0]) / t, 0.25 * t, (r[:, 1, 2] + r[:, 2, 1]) / t], axis=1)
+
+    r = m[case_z]
+    t = np.sqrt(1.0 + r[:, 2, 2] - r[:, 0, 0] - r[:, 1, 1]) * 2
+    quats[case_z] = np.stack([(r[:, 1, 0] - r[:, 0, 1]) / t, (r[:, 0, 2] + r[:, 2, 0]) / t, (r[:, 1, 2] + r[:, 2, 1]) / t, 0.25 * t], axis=1)
+
+    return quats / np.linalg.norm(quats, axis=1, keepdims=True)
+
+def reduce_keyframes(frames, values, tolerance):
+    """Mask of the keys to keep so linear interpolation between kept keys stays within tolerance of every dropped one"""
+    count = len(values)
+    keep = np.ones(count, dtype=bool)
+    if count < 3 or tolerance <= 0.0:
+        return keep
+
+    anchor = 0
+    for i in range(1, count - 1):
+        # Could the segment from the last kept key straight to the next key replace everything in between?
+        span = slice(anchor + 1, i + 1)
+        t = (frames[span] - frames[anchor]) / (frames[i + 1] - frames[anchor])
+        line = values[anchor] + (values[i + 1] - values[anchor]) * t
+        if np.abs(values[span] - line).max() <= tolerance:
+            keep[i] = False
+        else:
+            anchor = i
+    return keep
+
+def write_fcurve(action, obj, data_path, index, group, frames, values, linear=False):
+    """Create an F-Curve on an action and fill all of its keys with one keyframe_points.add and foreach_set.
+    'linear' switches every key to linear interpolation, which reduce_keyframes() assumes between the kept keys."""
+    if hasattr(action, "fcurve_ensure_for_datablock"):
+        fcurve = action.fcurve_ensure_for_datablock(obj, data_path, index=index, group_name=group)
+    else:
+        fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+
+    fcurve.keyframe_points.add(len(frames))
+    co = np.empty(len(frames) * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    fcurve.keyframe_points.foreach_set("co", co)
+    if linear:
+        linear_value = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
+        fcurve.keyframe_points.foreach_set("interpolation", np.full(len(frames), linear_value, dtype=np.int32))
+    fcurve.update()
+    return fcurve
 
 class RetargetArmaturesOperator(bpy.types.Operator):
     """Retarget one armature's set of bones to another (Must share bone names and manually apply new transforms afterwards)"""
@@ -1210,10 +2560,30 @@ class RetargetArmaturesOperator(bpy.types.Operator):
         precision=6,
     ) # type: ignore
 
+    bake_animation: bpy.props.BoolProperty(
+        name="Bake Frame Range",
+        description="Retarget every frame of the range into a new action instead of only the current pose",
+        default=False
+    ) # type: ignore
+    frame_start: bpy.props.IntProperty(name="Start Frame", default=1) # type: ignore
+    frame_end: bpy.props.IntProperty(name="End Frame", default=250) # type: ignore
+    frame_step: bpy.props.IntProperty(name="Frame Step", default=1, min=1) # type: ignore
+    reduce_keys: bpy.props.BoolProperty(
+        name="Reduce Keyframes",
+        description="Drop keys that linear interpolation between their neighbours already reproduces, the kept keys use linear interpolation",
+        default=False
+    ) # type: ignore
+    reduce_tolerance: bpy.props.FloatProperty(
+        name="Reduction Tolerance",
+        default=0.0001,
+        min=0.0,
+        precision=6,
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
         """Ensure at least one selected armature exists"""
-        return context.selected_objects and len([o for o in context.selected_objects if o.type == 'ARMATURE'])
+        return get_selection_summary(context)['armatures'] > 0
 
     def invoke(self, context, event):
         # If exactly two armatures are selected, prefill them
@@ -1221,6 +2591,10 @@ class RetargetArmaturesOperator(bpy.types.Operator):
         if len(arms) == 2:
             self.source_name = arms[0].name
             self.target_name = arms[1].name
+
+        # Default the bake range to the scene's
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
         return context.window_manager.invoke_props_dialog(self)
 
     def draw(self, context):
@@ -1235,6 +2609,19 @@ class RetargetArmaturesOperator(bpy.types.Operator):
         col.separator()
         col.prop(self, "threshold", text="Threshold")
 
+        box = layout.box()
+        box.prop(self, "bake_animation")
+        col = box.column(align=True)
+        col.enabled = self.bake_animation
+        col.prop(self, "frame_start")
+        col.prop(self, "frame_end")
+        col.prop(self, "frame_step")
+        col.separator()
+        col.prop(self, "reduce_keys")
+        row = col.row()
+        row.enabled = self.reduce_keys
+        row.prop(self, "reduce_tolerance")
+
     def execute(self, context):
         src = bpy.data.objects.get(self.source_name)
         tgt = bpy.data.objects.get(self.target_name)
@@ -1249,60 +2636,199 @@ class RetargetArmaturesOperator(bpy.types.Operator):
             self.report({'ERROR'}, "Source and Target Armatures must be different!")
             return {'CANCELLED'}
 
-        # Switch to Pose Mode on target
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.context.view_layer.objects.active = tgt
-        bpy.ops.object.mode_set(mode='POSE')
+        if self.bake_animation:
+            return self.bake(context, src, tgt)
 
-        matched = 0
-        skipped = 0
+        # Solve the whole pose in batches and write it back in one pass, no temporary constraints
+        basis, solved, skipped = solve_retarget_pose(src, tgt, self.threshold)
+        write_pose_basis(tgt, basis)
+        matched = int(solved.sum())
 
-        bpy.ops.pose.visual_transform_apply()
+        tgt.update_tag()
+        context.view_layer.update()
 
-        for tgt_bone in tgt.pose.bones:
-            name = tgt_bone.name
-            src_bone = src.pose.bones.get(name)
-            if not src_bone:
-                continue
+        self.report({'INFO'}, f"Applied transforms to {matched} bones. Skipped {skipped} bones.")
+        return {'FINISHED'}
 
-            # Compare world-space matrices
-            src_matrix = src.matrix_world @ src_bone.matrix
-            tgt_matrix = tgt.matrix_world @ tgt_bone.matrix
-            if matrices_equals(src_matrix, tgt_matrix, self.threshold):
-                skipped += 1
-                continue
+    def bake(self, context, src, tgt):
+        """Solve the pose for every frame of the range, then write all keys straight into a new action's F-Curves"""
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End frame must come after the start frame.")
+            return {'CANCELLED'}
 
-            # Add constraints
-            loc = tgt_bone.constraints.new(type='COPY_LOCATION')
-            loc.name = "Copy Location"
-            loc.target = src
-            loc.subtarget = name
+        scene = context.scene
+        frames = np.arange(self.frame_start, self.frame_end + 1, self.frame_step, dtype=np.float64)
 
-            rot = tgt_bone.constraints.new(type='COPY_ROTATION')
-            rot.name = "Copy Rotation"
-            rot.target = src
-            rot.subtarget = name
-            rot.target_space = 'POSE'
-            rot.owner_space = 'POSE'
+        hierarchy = get_bone_hierarchy(tgt.data)
+        src_names = set(src.pose.bones.keys())
+        rows = np.array([i for i, name in enumerate(hierarchy['names']) if name in src_names], dtype=np.int32)
+        if not len(rows):
+            self.report({'ERROR'}, "The armatures don't share any bone names.")
+            return {'CANCELLED'}
 
-            scl = tgt_bone.constraints.new(type='COPY_SCALE')
-            scl.name = "Copy Scale"
-            scl.target = src
-            scl.subtarget = name
+        # 1. Sample the source, the target's pose is never written while solving
+        original_frame = scene.frame_current
+        samples = np.empty((len(frames), len(rows), 4, 4), dtype=np.float64)
+        try:
+            for f, frame in enumerate(frames):
+                scene.frame_set(int(frame))
+                basis, _, _ = solve_retarget_pose(src, tgt, self.threshold)
+                samples[f] = basis[rows]
+        finally:
+            scene.frame_set(original_frame)
+
+        # 2. Decompose every bone on every frame in one batch
+        location, rotation, scale = decompose_matrices(samples.reshape(-1, 4, 4))
+        location = location.reshape(len(frames), len(rows), 3)
+        scale = scale.reshape(len(frames), len(rows), 3)
+        quats = rotation_matrices_to_quaternions(rotation).reshape(len(frames), len(rows), 4)
+
+        # Keep neighbouring quaternions in the same hemisphere so the curves don't flip
+        flips = np.einsum('fbi,fbi->fb', quats[1:], quats[:-1]) < 0
+        signs = np.cumprod(np.where(flips, -1.0, 1.0), axis=0)
+        quats[1:] *= signs[:, :, None]
+
+        # 3. Write the keys into a fresh action
+        action = bpy.data.actions.new(f"{tgt.name}_Retarget")
+        anim = tgt.animation_data_create()
+        replaced = anim.action
+        anim.action = action
+
+        key_count = 0
+        pose_bones = tgt.pose.bones
+        for b, row in enumerate(rows):
+            name = hierarchy['names'][row]
+            pose_bone = pose_bones[name]
+            path = f'pose.bones["{bpy.utils.escape_identifier(name)}"]'
+
+            channels = [("location", location[:, b])]
+            if pose_bone.rotation_mode == 'QUATERNION':
+                channels.append(("rotation_quaternion", quats[:, b]))
+            elif pose_bone.rotation_mode == 'AXIS_ANGLE':
+                axis_angles = [Quaternion(q).to_axis_angle() for q in quats[:, b]]
+                channels.append(("rotation_axis_angle", np.array([(angle, *axis) for axis, angle in axis_angles])))
+            else:
+                # Euler curves are converted per key, each one compatible with the previous to avoid flips
+                eulers = []
+                previous = None
+                for q in quats[:, b]:
+                    if previous is None:
+                        euler = Quaternion(q).to_euler(pose_bone.rotation_mode)
+                    else:
+                        euler = Quaternion(q).to_euler(pose_bone.rotation_mode, previous)
+                    eulers.append(tuple(euler))
+                    previous = euler
+                channels.append(("rotation_euler", np.array(eulers)))
+            channels.append(("scale", scale[:, b]))
+
+            for prop, values in channels:
+                for index in range(values.shape[1]):
+                    curve = values[:, index]
+                    keep = reduce_keyframes(frames, curve, self.reduce_tolerance) if self.reduce_keys else slice(None)
+                    kept_frames = frames[keep]
+                    write_fcurve(action, tgt, f"{path}.{prop}", index, name, kept_frames, curve[keep], linear=self.reduce_keys)
+                    key_count += len(kept_frames)
+
+        if replaced:
+            self.report({'WARNING'}, f"'{tgt.name}' was using the action '{replaced.name}', it was replaced by '{action.name}'.")
+        self.report({'INFO'}, f"Baked {len(rows)} bones over {len(frames)} frames into '{action.name}' ({key_count} keys).")
+        return {'FINISHED'}
 
-            matched += 1
+# --------------------------------------------------------------------------------------------------------------
 
-        # Apply and bake pose transforms
-        bpy.ops.pose.select_all(action='SELECT')
-        bpy.ops.pose.visual_transform_apply()
+class ComparePosesOperator(bpy.types.Operator):
+    """Report the per-bone location, rotation and scale difference between two armatures' poses (Must share bone names)"""
+    bl_idname = "object.compare_armature_poses"
+    bl_label = "Compare Armature Poses"
+    bl_options = {'REGISTER'}
 
-        # Remove the temporary constraints
-        for bone in tgt.pose.bones:
-            for c in list(bone.constraints):
-                if c.type in {'COPY_LOCATION', 'COPY_ROTATION', 'COPY_SCALE'}:
-                    bone.constraints.remove(c)
+    source_name: bpy.props.EnumProperty(
+        name="Source Armature",
+        description="Armature the pose is compared against",
+        items=enum_armatures,
+    ) # type: ignore
+    target_name: bpy.props.EnumProperty(
+        name="Target Armature",
+        description="Armature whose pose is checked",
+        items=enum_armatures,
+    ) # type: ignore
+    threshold: bpy.props.FloatProperty(
+        name="Threshold",
+        description="Matrix elements closer than this count as matching",
+        default=0.0001,
+        min=0.0,
+        precision=6,
+    ) # type: ignore
+    sort_by: bpy.props.EnumProperty(
+        name="Sort By",
+        items=[
+            ('ROTATION', "Rotation", "Worst rotation error first"),
+            ('LOCATION', "Location", "Worst location error first"),
+            ('SCALE', "Scale", "Worst scale error first"),
+        ],
+        default='ROTATION'
+    ) # type: ignore
+    report_count: bpy.props.IntProperty(
+        name="Bones to Report",
+        description="How many of the worst bones to list (the console gets all of them)",
+        default=10,
+        min=1,
+    ) # type: ignore
 
-        self.report({'INFO'}, f"Applied transforms to {matched} bones. Skipped {skipped} bones.")
+    @classmethod
+    def poll(cls, context):
+        """Ensure at least one selected armature exists"""
+        return get_selection_summary(context)['armatures'] > 0
+
+    def invoke(self, context, event):
+        # If exactly two armatures are selected, prefill them
+        arms = [o for o in context.selected_objects if o.type == 'ARMATURE']
+        if len(arms) == 2:
+            self.source_name = arms[0].name
+            self.target_name = arms[1].name
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column(align=True)
+        col.prop(self, "source_name", text="Source Armature")
+        col.prop(self, "target_name", text="Target Armature")
+
+        col.separator()
+        col.prop(self, "threshold")
+        col.prop(self, "sort_by")
+        col.prop(self, "report_count")
+
+    def execute(self, context):
+        src = bpy.data.objects.get(self.source_name)
+        tgt = bpy.data.objects.get(self.target_name)
+
+        if not src or not tgt or src.type != 'ARMATURE' or tgt.type != 'ARMATURE':
+            self.report({'ERROR'}, "Both must be armatures.")
+            return {'CANCELLED'}
+        if src == tgt:
+            self.report({'ERROR'}, "Source and Target Armatures must be different!")
+            return {'CANCELLED'}
+
+        result = compare_poses(src, tgt)
+        names = result['names']
+        if not names:
+            self.report({'WARNING'}, "The armatures don't share any bone names.")
+            return {'CANCELLED'}
+
+        matching = matrices_equal_mask(result['src_world'], result['tgt_world'], self.threshold)
+        order = np.argsort(-result[self.sort_by.lower()], kind='stable')
+
+        print(f"Pose comparison '{src.name}' -> '{tgt.name}' (location / rotation in degrees / scale):")
+        for i in order:
+            print(f"  {names[i]}: {result['location'][i]:.6f} / {result['rotation'][i]:.4f} / {result['scale'][i]:.6f}")
+
+        # Only differing bones are reported, a matching bone may sort above one that differs on another channel
+        for i in order[~matching[order]][:self.report_count]:
+            self.report({'INFO'}, f"{names[i]}: loc {result['location'][i]:.5f}, rot {result['rotation'][i]:.3f}°, scale {result['scale'][i]:.5f}")
+
+        self.report({'INFO'}, f"{len(names)} shared bones, {int((~matching).sum())} differ. Max error: "
+                              f"loc {result['location'].max():.5f}, rot {result['rotation'].max():.3f}°, scale {result['scale'].max():.5f}.")
         return {'FINISHED'}
 
 # --------------------------------------------------------------------------------------------------------------
@@ -1315,7 +2841,7 @@ class MakeCollectionPerMesh(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects is not None and any(obj.type == 'MESH' for obj in context.selected_objects)
+        return get_selection_summary(context)['meshes']
 
     def execute(self, context):
         # Filter selection to only meshes to avoid logic errors with lights/cameras
@@ -1349,86 +2875,205 @@ class MakeCollectionPerMesh(bpy.types.Operator):
     
 # --------------------------------------------------------------------------------------------------------------
 
+def build_material_template():
+    """Build the Principled BSDF -> Output material every batch material is copied from"""
+    template = bpy.data.materials.new(name="M_Template")
+
+    # Enable Nodes
+    template.use_nodes = True
+    nodes = template.node_tree.nodes
+    links = template.node_tree.links
+    nodes.clear()
+
+    # Create a basic node setup: Principled BSDF -> Output
+    node_output = nodes.new(type='ShaderNodeOutputMaterial')
+    node_output.location = (300, 0)
+
+    node_principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    node_principled.location = (0, 0)
+
+    # Link them
+    links.new(node_principled.outputs['BSDF'], node_output.inputs['Surface'])
+
+    return template, node_principled.name
+
 class BatchAddMaterialsOperator(bpy.types.Operator):
-    """Create a unique material with nodes for each selected object"""
+    """Create a material with nodes for each selected object, collection or name pattern"""
     bl_idname = "object.batch_add_material"
     bl_label = "Batch Add Materials to Objects"
     bl_options = {'REGISTER', 'UNDO'}
 
+    assign_mode: bpy.props.EnumProperty(
+        name="One Material Per",
+        items=[
+            ('OBJECT', "Object", "A unique material for each object, named M_<object>"),
+            ('COLLECTION', "Collection", "One shared material per collection, named M_<collection>"),
+            ('PATTERN', "Name Pattern", "One shared material per object name once the pattern is stripped from it"),
+        ],
+        default='OBJECT'
+    ) # type: ignore
+
+    name_pattern: bpy.props.StringProperty(
+        name="Pattern",
+        description="Regular expression removed from object names to group them (e.g. numeric suffixes)",
+        default=r"[._]\d+$"
+    ) # type: ignore
+
+    reuse_existing: bpy.props.BoolProperty(
+        name="Reuse Existing",
+        description="Assign an existing material with the same name instead of creating a '.001' duplicate",
+        default=True
+    ) # type: ignore
+
+    random_color: bpy.props.BoolProperty(
+        name="Random Colors",
+        description="Give each new material a random base color so you can visually see they are unique",
+        default=True
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' for obj in context.selected_objects)
+        return get_selection_summary(context)['meshes']
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "assign_mode")
+        if self.assign_mode == 'PATTERN':
+            layout.prop(self, "name_pattern")
+        layout.prop(self, "reuse_existing")
+        layout.prop(self, "random_color")
+
+    def material_key(self, obj, pattern):
+        """Name the material of an object is shared under"""
+        if self.assign_mode == 'COLLECTION':
+            return obj.users_collection[0].name if obj.users_collection else obj.name
+        if self.assign_mode == 'PATTERN':
+            return pattern.sub("", obj.name) or obj.name
+        return obj.name
 
     def execute(self, context):
-        selected_objects = context.selected_objects
+        # Only process objects that can actually hold materials (Meshes, Curves, etc.)
+        targets = [obj for obj in context.selected_objects if obj.type in {'MESH', 'CURVE', 'SURFACE', 'METABALL', 'FONT'}]
 
-        if not selected_objects:
+        if not targets:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
 
-        for obj in selected_objects:
-            # Only process objects that can actually hold materials (Meshes, Curves, etc.)
-            if obj.type not in {'MESH', 'CURVE', 'SURFACE', 'METABALL', 'FONT'}:
-                continue
-
-            # 1. Create a new material named after the object
-            mat_name = f"M_{obj.name}"
-            new_mat = bpy.data.materials.new(name=mat_name)
-            
-            # 2. Enable Nodes
-            new_mat.use_nodes = True
-            nodes = new_mat.node_tree.nodes
-            links = new_mat.node_tree.links
-            nodes.clear()
-
-            # 3. Create a basic node setup: Principled BSDF -> Output
-            node_output = nodes.new(type='ShaderNodeOutputMaterial')
-            node_output.location = (300, 0)
-
-            node_principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-            node_principled.location = (0, 0)
-            
-            # Example: Assign a random color so you can visually see they are unique
-            import random
-            node_principled.inputs['Base Color'].default_value = (
-                random.random(), 
-                random.random(), 
-                random.random(), 
-                1.0
-            )
-
-            # 5. Link them
-            links.new(node_principled.outputs['BSDF'], node_output.inputs['Surface'])
-
-            # 6. Assign to object
-            if obj.data.materials:
-                # Replace the first slot if it exists
-                obj.data.materials[0] = new_mat
-            else:
-                # Append if no slots exist
-                obj.data.materials.append(new_mat)
+        try:
+            pattern = re.compile(self.name_pattern)
+        except re.error as e:
+            self.report({'ERROR'}, f"Invalid name pattern: {e}")
+            return {'CANCELLED'}
 
-        self.report({'INFO'}, f"Created {len(selected_objects)} unique materials.")
+        # Look names up in one prebuilt index instead of searching bpy.data per object
+        material_index = {mat.name: mat for mat in bpy.data.materials} if self.reuse_existing else {}
+        # Materials made during this run, keyed by their intended name so shared groups find them
+        pool = {}
+        template = None
+        created = 0
+        reused = 0
+
+        try:
+            for obj in targets:
+                mat_name = f"M_{self.material_key(obj, pattern)}"
+                material = pool.get(mat_name)
+                if material is None:
+                    material = material_index.get(mat_name)
+                    if material is not None:
+                        pool[mat_name] = material
+                        reused += 1
+
+                if material is None:
+                    # Build the node tree once, every new material is a copy of it
+                    if template is None:
+                        template, principled_name = build_material_template()
+
+                    material = template.copy()
+                    material.name = mat_name
+                    if self.random_color:
+                        material.node_tree.nodes[principled_name].inputs['Base Color'].default_value = (
+                            random.random(),
+                            random.random(),
+                            random.random(),
+                            1.0
+                        )
+                    pool[mat_name] = material
+                    created += 1
+
+                # Assign to object
+                if obj.data.materials:
+                    # Replace the first slot if it exists
+                    obj.data.materials[0] = material
+                else:
+                    # Append if no slots exist
+                    obj.data.materials.append(material)
+        finally:
+            if template is not None:
+                bpy.data.materials.remove(template)
+
+        self.report({'INFO'}, f"Created {created} materials and reused {reused} across {len(targets)} objects.")
         return {'FINISHED'}
     
 # --------------------------------------------------------------------------------------------------------------
 
-# 1. Define your data in a clean dictionary
-SHAPEKEY_PRESETS = {
-# Apple ARKit Shape Key List
-'APPLE_ARKIT': [
-    "browDownLeft", "browDownRight", "browInnerUp", "browOuterUpLeft", "browOuterUpRight",
-    "cheekPuff", "cheekSquintLeft", "cheekSquintRight", "eyeBlinkLeft", "eyeBlinkRight",
-    "eyeLookDownLeft", "eyeLookDownRight", "eyeLookInLeft", "eyeLookInRight", "eyeLookOutLeft",
-    "eyeLookOutRight", "eyeLookUpLeft", "eyeLookUpRight", "eyeSquintLeft", "eyeSquintRight",
-    "eyeWideLeft", "eyeWideRight", "jawForward", "jawLeft", "jawRight", "jawOpen",
-    "mouthClose", "mouthDimpleLeft", "mouthDimpleRight", "mouthFrownLeft", "mouthFrownRight",
-    "mouthFunnel", "mouthLeft", "mouthLowerDownLeft", "mouthLowerDownRight", "mouthPressLeft",
-    "mouthPressRight", "mouthPucker", "mouthRight", "mouthRollLower", "mouthRollUpper",
-    "mouthShrugLower", "mouthShrugUpper", "mouthSmileLeft", "mouthSmileRight", "mouthStretchLeft",
-    "mouthStretchRight", "mouthUpperUpLeft", "mouthUpperUpRight", "noseSneerLeft", "noseSneerRight", "tongueOut"
-],
-}
+# Shape key sets live as JSON files ({"name", "description", "keys"}), drop new ones in this folder
+SHAPEKEY_PRESETS_DIR = os.path.join(os.path.dirname(__file__), "presets", "shape_keys")
+
+# Parsed presets per file path, each tagged with the file's modification time so edited files are read again
+SHAPEKEY_PRESETS = {}
+
+# Dropdown items stay referenced here so Blender never reads freed strings, 'files' maps each id to its file name
+SHAPEKEY_PRESET_ITEMS = {'mtime': None, 'items': [], 'files': {}}
+
+def read_shapekey_preset(path):
+    """Parse a preset's JSON file, or return the cached result while the file is unchanged"""
+    try:
+        mtime = os.path.getmtime(path)
+        cached = SHAPEKEY_PRESETS.get(path)
+        if cached is None or cached['mtime'] != mtime:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            cached = {'mtime': mtime, 'name': data.get("name"), 'description': data.get("description"), 'keys': list(data.get("keys", []))}
+            SHAPEKEY_PRESETS[path] = cached
+        return cached
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"Could not load shape key preset '{path}': {e}")
+        return None
+
+def get_shapekey_preset_items(self, context):
+    """List the preset files for the dropdown, re-reading their names only when the folder or one of the files changes"""
+    try:
+        file_names = sorted(f for f in os.listdir(SHAPEKEY_PRESETS_DIR) if f.lower().endswith(".json"))
+        mtime = tuple(os.path.getmtime(os.path.join(SHAPEKEY_PRESETS_DIR, f)) for f in file_names)
+    except OSError:
+        return [("NONE", "No Presets", f"No presets found in {SHAPEKEY_PRESETS_DIR}")]
+
+    mtime = (tuple(file_names), mtime)
+    if SHAPEKEY_PRESET_ITEMS['mtime'] != mtime:
+        items, files = [], {}
+        for file_name in file_names:
+            preset_id = os.path.splitext(file_name)[0].upper()
+            preset = read_shapekey_preset(os.path.join(SHAPEKEY_PRESETS_DIR, file_name))
+            if preset is None or preset_id in files:
+                continue
+            files[preset_id] = file_name
+            label = preset['name'] or preset_id.replace('_', ' ').title()
+            items.append((preset_id, label, preset['description'] or f"Add {label} shapes"))
+
+        SHAPEKEY_PRESET_ITEMS['items'] = items or [("NONE", "No Presets", f"No presets found in {SHAPEKEY_PRESETS_DIR}")]
+        SHAPEKEY_PRESET_ITEMS['files'] = files
+        SHAPEKEY_PRESET_ITEMS['mtime'] = mtime
+    return SHAPEKEY_PRESET_ITEMS['items']
+
+def load_shapekey_preset(preset_id):
+    """Return a preset's list of shape key names, reading its file again only if it changed"""
+    get_shapekey_preset_items(None, None)
+    file_name = SHAPEKEY_PRESET_ITEMS['files'].get(preset_id)
+    if file_name is None:
+        return []
+
+    preset = read_shapekey_preset(os.path.join(SHAPEKEY_PRESETS_DIR, file_name))
+    return preset['keys'] if preset else []
 
 class BatchAddEmptyShapeKeysOperator(bpy.types.Operator):
     """Add a batch of empty shape keys to selected objects"""
@@ -1438,13 +3083,12 @@ class BatchAddEmptyShapeKeysOperator(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_objects and any(obj.type == 'MESH' for obj in context.selected_objects)
+        return get_selection_summary(context)['meshes']
 
     # The Dropdown Property
     preset_type: bpy.props.EnumProperty(
         name="Shape Key Preset Set",
-        items=[(key, key.replace('_', ' ').title(), f"Add {key} shapes") for key in SHAPEKEY_PRESETS.keys()],
-        default='APPLE_ARKIT'
+        items=get_shapekey_preset_items
     ) # type: ignore
 
     def execute(self, context):
@@ -1454,30 +3098,38 @@ class BatchAddEmptyShapeKeysOperator(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Determine which list to use
-        shape_list = SHAPEKEY_PRESETS.get(self.preset_type, [])
+        shape_list = load_shapekey_preset(self.preset_type)
         
         if not shape_list:
             self.report({'ERROR'}, f"Preset {self.preset_type} not found.")
             return {'CANCELLED'}
         count_added = 0
+        buffer = None
 
-        for obj in selected:
-            if obj.type != 'MESH':
-                continue
-            
+        # Shape keys live on the mesh, so linked duplicates only get them once
+        meshes = unique_mesh_objects(selected)
+        for obj in meshes:
             # 1. Ensure Basis exists first
             if not obj.data.shape_keys:
-                obj.shape_key_add(name="Basis")
-            
-            existing_keys = obj.data.shape_keys.key_blocks.keys()
+                obj.shape_key_add(name="Basis", from_mix=False)
 
-            # 2. Add the shapes from the list
-            for name in shape_list:
-                if name not in existing_keys:
-                    obj.shape_key_add(name=name)
-                    count_added += 1
+            key = obj.data.shape_keys
+            existing_keys = set(key.key_blocks.keys())
+            missing = [name for name in dict.fromkeys(shape_list) if name not in existing_keys]
+            if not missing:
+                continue
 
-        self.report({'INFO'}, f"Added {count_added} empty shape keys across {len(selected)} objects.")
+            # 2. Read the basis once, every new key is written from this one buffer.
+            # KeyBlocks can only be created one at a time, so shape_key_add() per key is the floor, each one
+            # is then filled with a single foreach_set so it matches the basis even where the mesh positions don't
+            basis = read_flat_array(key.reference_key.data, "co", 3, buffer).reshape(-1)
+            buffer = basis.reshape(-1, 3)
+            for name in missing:
+                obj.shape_key_add(name=name, from_mix=False).data.foreach_set("co", basis)
+            count_added += len(missing)
+            obj.data.update()
+
+        self.report({'INFO'}, f"Added {count_added} empty shape keys across {len(meshes)} meshes.")
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -1486,65 +3138,136 @@ class BatchAddEmptyShapeKeysOperator(bpy.types.Operator):
     
 # --------------------------------------------------------------------------------------------------------------
 
+def collect_image_texture_nodes(trees):
+    """
+    Walk node trees and every node group nested in them, visiting each tree only once.
+    Returns the image texture nodes found, plus {tree: image nodes inside it, nested groups included}.
+    """
+    found = []
+    memo = {}
+
+    def walk(tree):
+        if tree in memo:
+            return memo[tree]
+        memo[tree] = 0  # Guards against a group that ends up containing itself
+
+        count = 0
+        for node in tree.nodes:
+            if node.type == 'TEX_IMAGE':
+                found.append(node)
+                count += 1
+            elif node.type == 'GROUP' and node.node_tree:
+                count += walk(node.node_tree)
+
+        memo[tree] = count
+        return count
+
+    for tree in trees:
+        walk(tree)
+    return found, memo
+
 class BatchCubicInterpolationConverterOperator(bpy.types.Operator):
     """Blender 4.5 and higher: Set all image textures in selected objects to Cubic interpolation"""
     bl_idname = "material.batch_cubic_interp_convert"
     bl_label = "Convert Textures' Interpolation to Cubic"
     bl_options = {'REGISTER', 'UNDO'}
 
+    interpolation: bpy.props.EnumProperty(
+        name="Interpolation",
+        items=[
+            ('Cubic', "Cubic", "Cubic interpolation"),
+            ('Linear', "Linear", "Linear interpolation"),
+            ('Closest', "Closest", "No interpolation (sample closest texel)"),
+            ('Smart', "Smart", "Bicubic when magnifying, else bilinear (OSL only)"),
+        ],
+        default='Cubic'
+    ) # type: ignore
+
+    set_extension: bpy.props.BoolProperty(name="Set Extension", default=False) # type: ignore
+    extension: bpy.props.EnumProperty(
+        name="Extension",
+        items=[
+            ('REPEAT', "Repeat", "Cause the image to repeat horizontally and vertically"),
+            ('EXTEND', "Extend", "Extend by repeating edge pixels of the image"),
+            ('CLIP', "Clip", "Clip to image size and set exterior pixels as transparent"),
+            ('MIRROR', "Mirror", "Repeatedly flip the image horizontally and vertically"),
+        ],
+        default='REPEAT'
+    ) # type: ignore
+
+    set_colorspace: bpy.props.BoolProperty(name="Set Color Space", default=False) # type: ignore
+    colorspace: bpy.props.StringProperty(
+        name="Color Space",
+        description="Color space applied to the textures' images (e.g. sRGB, Non-Color)",
+        default="sRGB"
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
         # Basic poll: Must be in Object Mode and have at least one mesh selected
         return context.active_object is not None and context.active_object.type == 'MESH'
 
-    def has_textures(self, obj):
-        """Check if object has a material with at least one texture"""
-        if not obj.material_slots:
-            return False
-            
-        for slot in obj.material_slots:
-            mat = slot.material
-            if mat and mat.use_nodes:
-                # Check if any node is an Image Texture
-                if any(n.type == 'TEX_IMAGE' for n in mat.node_tree.nodes):
-                    return True
-        return False
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "interpolation")
+
+        row = layout.row(heading="Extension")
+        row.prop(self, "set_extension", text="")
+        sub = row.row()
+        sub.enabled = self.set_extension
+        sub.prop(self, "extension", text="")
+
+        row = layout.row(heading="Color Space")
+        row.prop(self, "set_colorspace", text="")
+        sub = row.row()
+        sub.enabled = self.set_colorspace
+        sub.prop(self, "colorspace", text="")
 
     def execute(self, context):
-        # 1. Filter selection for meshes that actually have materials and textures
-        valid_objects = [o for o in context.selected_objects 
-                         if o.type == 'MESH' and self.has_textures(o)]
+        # Check the color space up front, nothing must be changed when the operation is cancelled
+        if self.set_colorspace:
+            colorspaces = bpy.types.ColorManagedInputColorspaceSettings.bl_rna.properties["name"].enum_items.keys()
+            if self.colorspace not in colorspaces:
+                self.report({'ERROR'}, f"Unknown color space '{self.colorspace}'.")
+                return {'CANCELLED'}
+
+        # 1. Gather each node-based material of the selected meshes once
+        materials = list(dict.fromkeys(
+            slot.material for obj in context.selected_objects if obj.type == 'MESH'
+            for slot in obj.material_slots if slot.material and slot.material.use_nodes and slot.material.node_tree
+        ))
+        material_trees = [mat.node_tree for mat in materials]
+
+        # 2. One walk over the materials and every shared node group below them
+        tex_nodes, image_counts = collect_image_texture_nodes(material_trees)
             
-        if not valid_objects:
+        if not tex_nodes:
             self.report({'WARNING'}, "No selected meshes have materials with image textures")
             return {'CANCELLED'}
 
-        processed_materials = set()
-        nodes_changed = 0
+        # 3. Update every image texture node found
+        for node in tex_nodes:
+            node.interpolation = self.interpolation
+            if self.set_extension:
+                node.extension = self.extension
 
-        # 2. Process only the valid objects
-        for obj in valid_objects:
-            for slot in obj.material_slots:
-                mat = slot.material
-                    
-                if not mat or not mat.use_nodes or mat in processed_materials:
-                    continue
-                    
-                # Update interpolation on all image texture nodes
-                tex_nodes = [n for n in mat.node_tree.nodes if n.type == 'TEX_IMAGE']
-                for node in tex_nodes:
-                    node.interpolation = 'Cubic'
-                    nodes_changed += 1
-                    
-                processed_materials.add(mat)
-
-        self.report({'INFO'}, f"Set {nodes_changed} texture nodes to Cubic across {len(processed_materials)} materials.")
+        if self.set_colorspace:
+            for image in {node.image for node in tex_nodes if node.image}:
+                image.colorspace_settings.name = self.colorspace
+
+        material_count = sum(1 for tree in material_trees if image_counts[tree])
+        trees = set(material_trees)
+        group_count = sum(1 for tree, count in image_counts.items() if count and tree not in trees)
+
+        self.report({'INFO'}, f"Set {len(tex_nodes)} texture nodes to {self.interpolation} across {material_count} materials and {group_count} node groups.")
         return {'FINISHED'}
 
 # --------------------------------------------------------------------------------------------------------------
 
 classes = [
+    DodyPreferences,
     DodyPanel,
+    DodyStatsPanel,
 
     RemoveVertexGroupsOperator,
     RemoveModifiersOperator,
@@ -1555,6 +3278,7 @@ classes = [
     RemoveUnusedVertexGroupsOperator,
     RemoveUnusedShapeKeysOperator,
     RemoveUnusedMaterialsOperator,
+    CleanupMeshOperator,
 
     ApplyAllModifiersOperator,
     CheckShapeKeyCount,
@@ -1568,6 +3292,7 @@ classes = [
     ArmatureMergeItem,
     MergeArmaturesOperator,
     RetargetArmaturesOperator,
+    ComparePosesOperator,
 
     MakeCollectionPerMesh,
     BatchAddMaterialsOperator,
@@ -0,0 +1,469 @@
+# --------
+# IMPORTS
+# --------
+
+import bpy
+import numpy as np
+import argparse
+import importlib.util
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+# ------
+# USAGE
+# ------
+
+# Headless benchmark for every operator of the add-on, run it through Blender:
+#   blender --background --factory-startup --python benchmarks/bench_operators.py -- [options]
+#
+# Options (after the "--"):
+#   --profile quick|full     Scene sizes to sweep (full goes up to 1M verts, 500 shape keys, 300 groups, 50 armatures)
+#   --repeat N               Runs per point, the fastest one is kept
+#   --only TEXT [TEXT ...]   Only benchmark operators whose idname contains one of these
+#   --output PATH            Where the JSON results are written
+#   --baseline PATH          Earlier results to compare against, exits with 1 on a regression
+#   --threshold RATIO        Slowdown ratio over the baseline that counts as a regression
+#   --noise-floor MS         Slowdowns smaller than this many milliseconds are ignored
+#   --slope-tolerance D      Growth of the log-log scaling slope that counts as a regression
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ---------------
+# SCENE SETTINGS
+# ---------------
+
+# Every point starts from this case, then the operator's own overrides, then the swept axis value
+BASE_CASE = {
+    'verts': 10_000,        # Per mesh object
+    'objects': 2,           # Mesh objects, each with its own mesh
+    'shape_keys': 8,        # Even keys move a chunk of vertices, odd keys are left unused
+    'vertex_groups': 16,    # Even groups get weights, odd groups stay empty
+    'material_slots': 8,    # Only the first half is assigned to faces
+    'armatures': 0,         # Share bone names, each drives a small skinned mesh
+    'bones': 64,            # Per armature, laid out as a binary tree
+    'triangles': False,     # Build the grids out of triangles instead of quads
+}
+
+# Values swept along each axis, per profile
+PROFILES = {
+    'quick': {
+        'verts': [1_000, 10_000, 100_000],
+        'objects': [1, 10, 50],
+        'shape_keys': [0, 20, 100],
+        'vertex_groups': [0, 30, 100],
+        'material_slots': [2, 16, 64],
+        'armatures': [2, 5, 10],
+        'bones': [16, 64, 256],
+    },
+    'full': {
+        'verts': [1_000, 10_000, 100_000, 1_000_000],
+        'objects': [1, 10, 100, 500],
+        'shape_keys': [0, 50, 200, 500],
+        'vertex_groups': [0, 50, 150, 300],
+        'material_slots': [2, 16, 64, 256],
+        'armatures': [2, 10, 25, 50],
+        'bones': [16, 64, 256, 1024],
+    },
+}
+
+# ----------------
+# OPERATOR SPECS
+# ----------------
+
+# Armature operators only need the rigs and their skinned meshes
+ARMATURE_CASE = {'objects': 0, 'armatures': 2}
+
+def merge_props(scene):
+    names = [obj.name for obj in scene['armatures']]
+    return {'source_name': names[0], 'sources': [{'name': name, 'is_selected': True} for name in names[1:]]}
+
+def pair_props(scene):
+    names = [obj.name for obj in scene['armatures']]
+    return {'source_name': names[0], 'target_name': names[1]}
+
+# How each operator is benchmarked: the axis it scales along, case overrides, what gets selected and its properties.
+# Props may be a callable taking the built scene. Operators missing here fail the run so new ones can't slip by.
+SPECS = {
+    "object.remove_vertex_groups": {'axis': 'vertex_groups'},
+    "object.remove_modifiers": {'axis': 'objects'},
+    "object.remove_vertex_colors": {'axis': 'verts'},
+    "object.remove_shape_keys": {'axis': 'shape_keys'},
+    "object.remove_uv_maps": {'axis': 'verts'},
+    "object.remove_materials": {'axis': 'verts'},
+    "object.remove_unused_vertex_groups": {'axis': 'verts'},
+    "object.remove_unused_shape_keys": {'axis': 'shape_keys'},
+    "object.remove_unused_materials": {'axis': 'material_slots'},
+    "object.cleanup_mesh": {'axis': 'material_slots', 'props': {'vertex_colors': True}},
+
+    "object.apply_modifiers": {'axis': 'verts', 'case': {'shape_keys': 4}},
+    "object.check_shapekey_count": {'axis': 'shape_keys'},
+    "object.flip_uv_horizontally": {'axis': 'verts', 'props': {'all_layers': True}},
+    "object.flip_uv_vertically": {'axis': 'verts', 'props': {'all_layers': True}},
+    "object.batch_add_vertex_color": {'axis': 'verts'},
+    "object.project_key_to_color": {'axis': 'verts', 'case': {'shape_keys': 2}, 'props': {'shape_key_name': "Key.000"}},
+    "object.project_color_to_key": {'axis': 'verts', 'props': {'color_layer': "Col"}},
+    "object.batch_tris_to_quads": {'axis': 'verts', 'case': {'triangles': True}},
+
+    "object.merge_armatures": {'axis': 'armatures', 'case': ARMATURE_CASE, 'select': 'armatures', 'props': merge_props},
+    "object.retarget_armatures": {'axis': 'bones', 'case': ARMATURE_CASE, 'select': 'armatures', 'props': pair_props},
+    "object.compare_armature_poses": {'axis': 'bones', 'case': ARMATURE_CASE, 'select': 'armatures', 'props': pair_props},
+
+    "object.make_collection_per_mesh": {'axis': 'objects', 'case': {'verts': 1_000}},
+    "object.batch_add_material": {'axis': 'objects', 'case': {'verts': 1_000}},
+    "object.batch_add_empty_shapekeys": {'axis': 'objects', 'case': {'verts': 1_000}, 'props': {'preset_type': "APPLE_ARKIT"}},
+    "material.batch_cubic_interp_convert": {'axis': 'objects', 'case': {'verts': 1_000}},
+}
+
+# ----------------
+# ADDON LOADING
+# ----------------
+
+def load_addon():
+    """Import the add-on straight from this checkout and register it"""
+    spec = importlib.util.spec_from_file_location(
+        "io_dody_shortcuts", os.path.join(ADDON_DIR, "__init__.py"), submodule_search_locations=[ADDON_DIR]
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = addon
+    spec.loader.exec_module(addon)
+
+    # Keep the instrumentation's timing, tracemalloc and log writes out of the measurements
+    addon.TELEMETRY_DEFAULTS['enabled'] = False
+    addon.register()
+    return addon
+
+def operator_classes(addon):
+    return [cls for cls in addon.classes if issubclass(cls, bpy.types.Operator)]
+
+def get_operator(idname):
+    category, name = idname.split(".", 1)
+    return getattr(getattr(bpy.ops, category), name)
+
+# ----------------
+# SCENE GENERATOR
+# ----------------
+
+def clear_scene():
+    """Remove everything a previous run created in one batch"""
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    data = bpy.data
+    ids = [*data.objects, *data.meshes, *data.armatures, *data.materials, *data.node_groups,
+           *data.images, *data.actions, *data.collections]
+    if ids:
+        data.batch_remove(ids)
+
+def grid_arrays(verts, triangles=False):
+    """Vertex positions and face indices of a square grid with at least `verts` vertices"""
+    side = max(2, math.ceil(math.sqrt(verts)))
+    xs, ys = np.meshgrid(np.linspace(-1.0, 1.0, side), np.linspace(-1.0, 1.0, side))
+    co = np.column_stack((xs.ravel(), ys.ravel(), np.zeros(side * side))).astype(np.float32)
+
+    index = np.arange(side * side, dtype=np.int32).reshape(side, side)
+    a, b = index[:-1, :-1].ravel(), index[:-1, 1:].ravel()
+    c, d = index[1:, 1:].ravel(), index[1:, :-1].ravel()
+    if triangles:
+        faces = np.concatenate((np.column_stack((a, b, c)), np.column_stack((a, c, d))))
+    else:
+        faces = np.column_stack((a, b, c, d))
+    return co, faces
+
+def make_mesh(name, co, faces):
+    """Fill a new mesh from arrays without going through per-element Python"""
+    mesh = bpy.data.meshes.new(name)
+    face_count, corners = faces.shape
+
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(face_count * corners)
+    mesh.loops.foreach_set("vertex_index", faces.ravel())
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, face_count * corners, corners, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.full(face_count, corners, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    # Two UV layers so the "all layers" paths get exercised
+    uvs = (co[faces.ravel(), :2] * 0.5 + 0.5).ravel()
+    for uv_name in ("UVMap", "UVMap.001"):
+        mesh.uv_layers.new(name=uv_name).data.foreach_set("uv", uvs)
+    return mesh
+
+def make_materials(count):
+    """Node materials with an image texture, half of them through a shared node group"""
+    image = bpy.data.images.new("Bench Image", 8, 8)
+    group = bpy.data.node_groups.new("Bench Group", 'ShaderNodeTree')
+    group.nodes.new('ShaderNodeTexImage').image = image
+
+    materials = []
+    for i in range(count):
+        mat = bpy.data.materials.new(f"Bench.{i:03d}")
+        mat.use_nodes = True
+        if i % 2:
+            mat.node_tree.nodes.new('ShaderNodeGroup').node_tree = group
+        else:
+            mat.node_tree.nodes.new('ShaderNodeTexImage').image = image
+        materials.append(mat)
+    return materials
+
+def make_mesh_object(name, case, materials, rng, collection):
+    co, faces = grid_arrays(case['verts'], case['triangles'])
+    mesh = make_mesh(name, co, faces)
+    obj = bpy.data.objects.new(name, mesh)
+    collection.objects.link(obj)
+
+    color = mesh.color_attributes.new("Col", 'FLOAT_COLOR', 'POINT')
+    color.data.foreach_set("color", rng.random(len(co) * 4, dtype=np.float32))
+
+    # Half the slots are used, the rest only sit on the object
+    for mat in materials:
+        mesh.materials.append(mat)
+    if materials:
+        used = max(1, len(materials) // 2)
+        mesh.polygons.foreach_set("material_index", (np.arange(len(faces)) % used).astype(np.int32))
+
+    groups = case['vertex_groups']
+    for i, chunk in enumerate(np.array_split(np.arange(len(co)), groups) if groups else []):
+        group = obj.vertex_groups.new(name=f"Group.{i:03d}")
+        if i % 2 == 0 and len(chunk):
+            group.add(chunk.tolist(), 0.5, 'REPLACE')
+
+    keys = case['shape_keys']
+    if keys:
+        obj.shape_key_add(name="Basis", from_mix=False)
+        for i, chunk in enumerate(np.array_split(np.arange(len(co)), keys)):
+            key = obj.shape_key_add(name=f"Key.{i:03d}", from_mix=False)
+            if i % 2 == 0 and len(chunk):
+                moved = co.copy()
+                moved[chunk, 2] += 0.1
+                key.data.foreach_set("co", moved.ravel())
+
+    obj.modifiers.new("Displace", 'DISPLACE')
+    obj.modifiers.new("Smooth", 'SMOOTH')
+    return obj
+
+def make_armature(name, bones, rng, collection):
+    """Armature with shared bone names, laid out as a binary tree so the hierarchy has depth"""
+    arm = bpy.data.armatures.new(name)
+    obj = bpy.data.objects.new(name, arm)
+    collection.objects.link(obj)
+
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = []
+    for i in range(bones):
+        bone = arm.edit_bones.new(f"Bone.{i:04d}")
+        parent = edit_bones[(i - 1) // 2] if i else None
+        head = parent.tail.copy() if parent else (0.0, 0.0, 0.0)
+        bone.head = head
+        bone.tail = (head[0] + rng.uniform(-0.05, 0.05), head[1] + rng.uniform(-0.05, 0.05), head[2] + 0.1)
+        bone.parent = parent
+        edit_bones.append(bone)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # A pose to retarget and compare
+    for pose_bone in obj.pose.bones:
+        pose_bone.rotation_quaternion = (1.0, *rng.uniform(-0.2, 0.2, 3))
+        pose_bone.rotation_quaternion.normalize()
+    return obj
+
+def build_scene(case, rng):
+    """Generate a synthetic scene for a case, returns the mesh and armature objects"""
+    collection = bpy.context.scene.collection
+    materials = make_materials(case['material_slots'])
+    meshes = [make_mesh_object(f"Mesh.{i:03d}", case, materials, rng, collection) for i in range(case['objects'])]
+
+    armatures = []
+    for i in range(case['armatures']):
+        armature = make_armature(f"Armature.{i:03d}", case['bones'], rng, collection)
+        skinned = make_mesh_object(f"Skin.{i:03d}", dict(case, verts=1_000, shape_keys=0, vertex_groups=0), [], rng, collection)
+        skinned.parent = armature
+        skinned.modifiers.new("Armature", 'ARMATURE').object = armature
+        armatures.append(armature)
+
+    bpy.context.view_layer.update()
+    return {'meshes': meshes, 'armatures': armatures}
+
+# ----------
+# RUNNING
+# ----------
+
+def run_point(addon, idname, spec, case, repeat, seed):
+    """Benchmark one operator at one case, on a freshly built scene every run"""
+    operator = get_operator(idname)
+    runs = []
+    status, message = "ok", ""
+
+    for _ in range(repeat):
+        clear_scene()
+        scene = build_scene(case, np.random.default_rng(seed))
+
+        selected = scene[spec.get('select', 'meshes')]
+        view_layer = bpy.context.view_layer
+        for obj in view_layer.objects:
+            obj.select_set(obj in selected)
+        view_layer.objects.active = selected[0] if selected else None
+        addon.invalidate_selection_summary()
+
+        props = spec.get('props', {})
+        props = props(scene) if callable(props) else props
+
+        if not operator.poll():
+            return {'status': "skipped", 'message': "poll failed", 'runs': []}
+
+        start = time.perf_counter()
+        try:
+            result = operator('EXEC_DEFAULT', **props)
+        except (RuntimeError, TypeError) as e:
+            return {'status': "error", 'message': str(e).strip(), 'runs': []}
+        runs.append((time.perf_counter() - start) * 1000.0)
+
+        if 'FINISHED' not in result:
+            status, message = "cancelled", ", ".join(result)
+
+    return {
+        'status': status,
+        'message': message,
+        'ms': min(runs),
+        'median_ms': statistics.median(runs),
+        'runs': runs,
+    }
+
+def scaling_slope(points):
+    """Log-log slope of time against the swept axis: ~1 is linear, ~2 quadratic"""
+    usable = [(p['x'], p['ms']) for p in points if p['status'] == "ok" and p['x'] > 0 and p['ms'] > 0]
+    if len(usable) < 2:
+        return None
+    xs, ys = np.log([x for x, _ in usable]), np.log([y for _, y in usable])
+    return float(np.polyfit(xs, ys, 1)[0])
+
+def run_benchmarks(addon, args):
+    profile = PROFILES[args.profile]
+    results = {}
+
+    for cls in operator_classes(addon):
+        idname = cls.bl_idname
+        if args.only and not any(text in idname for text in args.only):
+            continue
+
+        spec = SPECS.get(idname)
+        if spec is None:
+            print(f"{idname}: no benchmark spec")
+            results[idname] = {'class': cls.__name__, 'status': "missing_spec", 'points': []}
+            continue
+
+        axis = spec['axis']
+        points = []
+        for x in profile[axis]:
+            case = dict(BASE_CASE, **spec.get('case', {}))
+            case[axis] = x
+            point = run_point(addon, idname, spec, case, args.repeat, args.seed)
+            point.update(x=x, case=case)
+            points.append(point)
+
+            timing = f"{point['ms']:.2f} ms" if point['status'] == "ok" else point['message']
+            print(f"{idname} [{axis}={x}]: {point['status']} {timing}")
+
+        results[idname] = {
+            'class': cls.__name__,
+            'axis': axis,
+            'status': "ok",
+            'points': points,
+            'slope': scaling_slope(points),
+        }
+
+    clear_scene()
+    return results
+
+# ------------
+# COMPARISON
+# ------------
+
+def compare(results, baseline, args):
+    """List the regressions against a baseline: slower points, steeper scaling, or runs that stopped working"""
+    regressions = []
+
+    for idname, current in results.items():
+        if current['status'] == "missing_spec":
+            regressions.append(f"{idname}: operator has no benchmark spec")
+            continue
+
+        previous = baseline.get('operators', {}).get(idname)
+        if not previous or previous.get('axis') != current['axis']:
+            continue
+
+        before = {p['x']: p for p in previous['points']}
+        for point in current['points']:
+            old = before.get(point['x'])
+            if not old or old['status'] != "ok":
+                continue
+            if point['status'] != "ok":
+                regressions.append(f"{idname} [{current['axis']}={point['x']}]: was ok, now {point['status']} ({point['message']})")
+                continue
+
+            ratio = point['ms'] / max(old['ms'], 1e-6)
+            if ratio > args.threshold and point['ms'] - old['ms'] > args.noise_floor:
+                regressions.append(f"{idname} [{current['axis']}={point['x']}]: {old['ms']:.2f} -> {point['ms']:.2f} ms ({ratio:.2f}x)")
+
+        old_slope, new_slope = previous.get('slope'), current['slope']
+        if old_slope is not None and new_slope is not None and new_slope - old_slope > args.slope_tolerance:
+            regressions.append(f"{idname}: scaling slope {old_slope:.2f} -> {new_slope:.2f}")
+
+    return regressions
+
+# -----
+# MAIN
+# -----
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_operators.py", description="Benchmark every operator of Dody's Shortcuts")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", default=[])
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--noise-floor", type=float, default=5.0)
+    parser.add_argument("--slope-tolerance", type=float, default=0.25)
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    addon = load_addon()
+
+    results = {
+        'blender': bpy.app.version_string,
+        'addon_version': list(addon.bl_info['version']),
+        'profile': args.profile,
+        'repeat': args.repeat,
+        'base_case': BASE_CASE,
+        'operators': run_benchmarks(addon, args),
+    }
+    addon.unregister()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    regressions = compare(results['operators'], baseline, args)
+    if regressions:
+        print(f"{len(regressions)} regression(s):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("No regressions.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+# --------
+# IMPORTS
+# --------
+
+import argparse
+import ast
+import concurrent.futures
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+try:
+    import bpy
+except ImportError:
+    bpy = None  # Running as the coordinator, outside of Blender
+
+# ------
+# USAGE
+# ------
+
+# Apply a recipe of this add-on's operators (and only those) to many .blend files, one background Blender per file:
+#   python tools/batch_runner.py recipe.json assets/ other.blend [options]
+#
+# A recipe is an ordered list of steps, "select" picks the objects a step runs on (MESH, ARMATURE, ALL or a list of names):
+#   {"steps": [
+#       {"op": "object.remove_unused_shape_keys", "select": "MESH"},
+#       {"op": "object.apply_modifiers", "props": {"apply_armature": false}}
+#   ]}
+#
+# Options:
+#   --blender PATH       Blender executable (defaults to $BLENDER, then "blender" on the PATH)
+#   --jobs N             Blender processes running at once (defaults to the core count)
+#   --timeout SECONDS    Per-file limit, the file's process gets killed past it
+#   --dry-run            Run the recipe without saving anything
+#   --output-dir PATH    Save the results there instead of over the original files
+#   --report PATH        Where the aggregated JSON report is written
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SELECT_TYPES = {'MESH', 'ARMATURE', 'ALL'}
+
+# -------
+# RECIPE
+# -------
+
+def addon_operator_idnames():
+    """The bl_idname of every operator class in the add-on, read from its source so the coordinator needs no Blender"""
+    with open(os.path.join(ADDON_DIR, "__init__.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    idnames = set()
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or not any(ast.unparse(base).endswith("Operator") for base in node.bases):
+            continue
+        for statement in node.body:
+            if (isinstance(statement, ast.Assign) and isinstance(statement.value, ast.Constant)
+                    and any(isinstance(target, ast.Name) and target.id == "bl_idname" for target in statement.targets)):
+                idnames.add(statement.value.value)
+    return idnames
+
+def load_recipe(path):
+    """Read a recipe and check its steps before any Blender gets started"""
+    with open(path, encoding="utf-8") as f:
+        recipe = json.load(f)
+
+    steps = recipe.get("steps") if isinstance(recipe, dict) else recipe
+    if not isinstance(steps, list) or not steps:
+        raise ValueError("The recipe needs a non-empty list of steps")
+
+    idnames = addon_operator_idnames()
+    for i, step in enumerate(steps, 1):
+        op = step.get("op") if isinstance(step, dict) else None
+        if not isinstance(op, str) or op.count(".") != 1:
+            raise ValueError(f"Step {i}: 'op' must be an operator idname like object.remove_unused_shape_keys")
+        if op not in idnames:
+            raise ValueError(f"Step {i}: '{op}' is not an operator of this add-on")
+        if not isinstance(step.get("props", {}), dict):
+            raise ValueError(f"Step {i}: 'props' must be an object")
+        select = step.get("select", 'ALL')
+        if not (select in SELECT_TYPES or isinstance(select, list)):
+            raise ValueError(f"Step {i}: 'select' must be one of {sorted(SELECT_TYPES)} or a list of object names")
+    return steps
+
+def find_blend_files(paths):
+    """The .blend files given, folders are searched recursively"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(".blend"))
+        elif path.endswith(".blend"):
+            files.append(path)
+    return list(dict.fromkeys(os.path.abspath(f) for f in files))
+
+# -------------
+# COORDINATOR
+# -------------
+
+def output_tail(text, lines=20):
+    return "\n".join((text or "").strip().splitlines()[-lines:])
+
+def run_file(blender, blend_file, recipe_path, root, args):
+    """Run the recipe on one file in its own background Blender and return its result"""
+    save_path = None
+    if not args.dry_run:
+        save_path = blend_file
+        if args.output_dir:
+            # Mirror the folder layout so files with the same name don't overwrite each other
+            save_path = os.path.join(args.output_dir, os.path.relpath(blend_file, root))
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+    fd, result_path = tempfile.mkstemp(prefix="dody_batch_", suffix=".json")
+    os.close(fd)
+
+    command = [
+        blender, "--background", "--factory-startup", blend_file,
+        "--python", os.path.abspath(__file__), "--",
+        "--worker", "--recipe", recipe_path, "--result", result_path,
+    ]
+    if save_path:
+        command += ["--save", save_path]
+
+    start = time.perf_counter()
+    result = {'file': blend_file, 'status': "crashed", 'saved': None, 'steps': []}
+    try:
+        process = subprocess.run(command, capture_output=True, text=True, timeout=args.timeout)
+        try:
+            with open(result_path, encoding="utf-8") as f:
+                result.update(json.load(f))
+        except (OSError, ValueError):
+            result['output'] = output_tail(process.stderr or process.stdout)
+        else:
+            if result['status'] != "ok":
+                result['output'] = output_tail(process.stderr or process.stdout)
+    except subprocess.TimeoutExpired as e:
+        result['status'] = "timeout"
+        result['output'] = output_tail(e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else e.stderr)
+    finally:
+        os.remove(result_path)
+
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+def run_coordinator(args):
+    blender = args.blender or os.environ.get("BLENDER") or shutil.which("blender")
+    if not blender:
+        print("Blender executable not found, pass it with --blender or the BLENDER environment variable")
+        return 2
+
+    try:
+        steps = load_recipe(args.recipe)
+    except (OSError, ValueError) as e:
+        print(f"Invalid recipe '{args.recipe}': {e}")
+        return 2
+
+    files = find_blend_files(args.files)
+    if not files:
+        print("No .blend files found")
+        return 2
+    root = os.path.dirname(files[0]) if len(files) == 1 else os.path.commonpath(files)
+
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(files)))
+    recipe_path = os.path.abspath(args.recipe)
+    print(f"Running {len(steps)} steps on {len(files)} files with {jobs} Blender processes{' (dry run)' if args.dry_run else ''}")
+
+    start = time.perf_counter()
+    results = []
+    # Threads only wait on the Blender processes, the actual work runs in parallel across them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_file, blender, blend_file, recipe_path, root, args) for blend_file in files]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(files)}] {result['status']:<8} {result['seconds']:>8.2f}s  {result['file']}")
+
+    results.sort(key=lambda result: result['file'])
+    summary = {}
+    for result in results:
+        summary[result['status']] = summary.get(result['status'], 0) + 1
+
+    report = {
+        'recipe': recipe_path,
+        'steps': steps,
+        'dry_run': args.dry_run,
+        'jobs': jobs,
+        'timeout': args.timeout,
+        'seconds': round(time.perf_counter() - start, 3),
+        'summary': summary,
+        'files': results,
+    }
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(", ".join(f"{count} {status}" for status, count in sorted(summary.items())) + f". Report written to {args.report}")
+    return 0 if summary.get("ok", 0) == len(results) else 1
+
+# -------
+# WORKER
+# -------
+
+def load_addon():
+    """Import the add-on straight from this checkout, --factory-startup leaves the installed one out"""
+    spec = importlib.util.spec_from_file_location(
+        "io_dody_shortcuts", os.path.join(ADDON_DIR, "__init__.py"), submodule_search_locations=[ADDON_DIR]
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = addon
+    spec.loader.exec_module(addon)
+
+    # Keep the timing records for the report, but don't have every worker appending to the same log
+    addon.TELEMETRY_DEFAULTS.update(enabled=True, trace_memory=False, profile=False, write_log=False)
+    addon.register()
+    return addon
+
+def select_objects(addon, select):
+    """Select the objects a step runs on and make the first one active"""
+    view_layer = bpy.context.view_layer
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    if isinstance(select, list):
+        names = set(select)
+        selected = [obj for obj in view_layer.objects if obj.name in names]
+    else:
+        selected = [obj for obj in view_layer.objects if select == 'ALL' or obj.type == select]
+
+    for obj in view_layer.objects:
+        obj.select_set(obj in selected)
+    view_layer.objects.active = selected[0] if selected else None
+    addon.invalidate_selection_summary()
+    return selected
+
+def run_step(addon, step):
+    """Run one recipe step, returns its result entry"""
+    entry = {'op': step["op"], 'status': "error", 'message': ""}
+
+    # Recipes may only run this add-on's own operators
+    idnames = {cls.bl_idname for cls in addon.classes if issubclass(cls, bpy.types.Operator)}
+    if step["op"] not in idnames:
+        entry['message'] = "Not an operator of this add-on"
+        return entry
+
+    category, name = step["op"].split(".")
+    operator = getattr(getattr(bpy.ops, category, None), name, None)
+    if operator is None or not hasattr(bpy.types, operator.idname()):
+        entry['message'] = "Unknown operator"
+        return entry
+
+    selected = select_objects(addon, step.get("select", 'ALL'))
+    entry['objects'] = len(selected)
+    if not operator.poll():
+        entry.update(status="skipped", message="Nothing in the file this step applies to")
+        return entry
+
+    records = len(addon.RECENT_OPERATIONS)
+    try:
+        result = operator('EXEC_DEFAULT', **step.get("props", {}))
+    except (RuntimeError, TypeError, ValueError) as e:
+        entry['message'] = str(e).strip()
+        return entry
+
+    entry['status'] = "finished" if 'FINISHED' in result else "cancelled"
+    if len(addon.RECENT_OPERATIONS) > records:
+        record = addon.RECENT_OPERATIONS[-1]
+        entry.update(ms=record['ms'], selected_elements=record['selected_elements'])
+    return entry
+
+def run_worker(args):
+    """Inside Blender: run every step on the open file, then save it unless a step failed"""
+    result = {'status': "error", 'saved': None, 'steps': []}
+    try:
+        addon = load_addon()
+        with open(args.recipe, encoding="utf-8") as f:
+            recipe = json.load(f)
+        steps = recipe.get("steps") if isinstance(recipe, dict) else recipe
+
+        for step in steps:
+            entry = run_step(addon, step)
+            result['steps'].append(entry)
+            if entry['status'] == "error":
+                break
+        else:
+            changed = any(entry['status'] == "finished" for entry in result['steps'])
+            if args.save and changed:
+                if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+                    bpy.ops.object.mode_set(mode='OBJECT')
+                if os.path.abspath(args.save) == os.path.abspath(bpy.data.filepath):
+                    bpy.ops.wm.save_mainfile()
+                else:
+                    bpy.ops.wm.save_as_mainfile(filepath=args.save, copy=True)
+                result['saved'] = args.save
+            result['status'] = "ok"
+    except Exception:
+        result['error'] = traceback.format_exc()
+
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+# -----
+# MAIN
+# -----
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="batch_runner.py", description="Apply a recipe of Dody's Shortcuts operators to many .blend files")
+    parser.add_argument("recipe", nargs="?", help="Recipe JSON with the ordered operator steps")
+    parser.add_argument("files", nargs="*", help=".blend files or folders to search for them")
+    parser.add_argument("--blender", default=None)
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--report", default="batch_report.json")
+
+    # Used by the coordinator when it starts a worker
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--recipe", dest="worker_recipe", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--result", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--save", default=None, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main():
+    if bpy is not None:
+        # Inside Blender only the arguments after "--" are ours
+        args = parse_args(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+        if not args.worker:
+            print("batch_runner.py runs the recipe from outside Blender, start it with python")
+            return
+        args.recipe = args.worker_recipe
+        run_worker(args)
+        return
+
+    args = parse_args(sys.argv[1:])
+    if not args.recipe or not args.files:
+        parse_args(["--help"])
+    sys.exit(run_coordinator(args))
+
+if __name__ == "__main__":
+    main()